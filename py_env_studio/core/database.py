@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import atexit
 import sqlite3
+import threading
 from pathlib import Path
 
 from .runtime import get_runtime_config
@@ -19,15 +21,53 @@ class DatabaseManager:
         runtime = get_runtime_config()
         self.db_path = Path(db_path or runtime.db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # One cached connection per thread: sqlite3.connect costs ~1-2 ms
+        # plus file locking, and the helpers touch the DB from both the UI
+        # thread and worker pools
+        self._tls = threading.local()
+        # threading.local can't be enumerated, so track every connection
+        # for the shutdown sweep
+        self._open_conns: list[sqlite3.Connection] = []
+        self._conns_lock = threading.Lock()
+        atexit.register(self.close_all)
 
     def connect(self) -> sqlite3.Connection:
+        conn = getattr(self._tls, "conn", None)
+        if conn is not None:
+            return conn
         try:
-            conn = sqlite3.connect(self.db_path)
+            # The tls cache keeps each connection on its own thread; the
+            # check is disabled only so the atexit sweep can close them
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
             conn.execute("PRAGMA foreign_keys = ON")
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute("PRAGMA temp_store = MEMORY")
+            # Map the file (up to 256 MiB) and give the page cache 64 MiB
+            # so vulnerability-history reads stay out of the read() path
+            conn.execute("PRAGMA mmap_size = 268435456")
+            conn.execute("PRAGMA cache_size = -65536")
+            # Concurrent scan threads may commit near-simultaneously; wait
+            # for the WAL writer lock instead of failing with SQLITE_BUSY
+            conn.execute("PRAGMA busy_timeout = 5000")
+            self._tls.conn = conn
+            with self._conns_lock:
+                self._open_conns.append(conn)
             return conn
         except sqlite3.Error as exc:
             raise DatabaseError(f"Failed to connect to DB: {exc}") from exc
 
+    def close_all(self) -> None:
+        """Close every cached connection (registered to run at exit)."""
+        with self._conns_lock:
+            conns, self._open_conns = self._open_conns, []
+        for conn in conns:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        self._tls = threading.local()
+
     def initialize_database(self) -> None:
         try:
             with self.connect() as conn:
@@ -65,6 +105,13 @@ class DatabaseManager:
                     """
                 )
 
+                cur.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_evi_env_date
+                    ON env_vulnerability_info(env_id, created_at DESC)
+                    """
+                )
+
                 self._migrate_legacy_schema(cur)
                 conn.commit()
         except sqlite3.Error as exc:
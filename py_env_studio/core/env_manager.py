@@ -97,6 +97,24 @@ def add_tool(name, path=None):
         app_config.set_param("settings", "open_with_tools", ",".join(entries))
 
 
+def set_tools(names):
+    """Persist the full open-with tool list in a single config write.
+
+    Replaces per-tool add_tool loops, which rewrite the config file once
+    per tool. Existing ``name:path`` entries keep their paths.
+    """
+    app_config = AppConfig()
+    tools_raw = app_config.get_param("settings", "open_with_tools", fallback="") or ""
+    existing = {}
+    for entry in (e.strip() for e in tools_raw.split(",")):
+        if not entry:
+            continue
+        key = entry.split(":", 1)[0].strip().lower() if ":" in entry else entry.lower()
+        existing[key] = entry
+    entries = [existing.get(name.lower(), name) for name in names]
+    app_config.set_param("settings", "open_with_tools", ",".join(entries))
+
+
 def _load_env_data():
     path = Path(ENV_DATA_FILE)
     if not path.exists():
@@ -1,8 +1,11 @@
 #pip_tools.py
+import glob
+import os
 import subprocess
 import logging
 import re
-from .env_manager import get_env_python
+from importlib.metadata import distributions
+from .env_manager import VENV_DIR, get_env_python
 from . import auto_resolve
 
 def get_pip_version() -> str:
@@ -27,20 +30,48 @@ def get_pip_version() -> str:
         pass
     return ""
 
+def _get_site_packages(env_name):
+    """Locate the site-packages directory of an environment, or None."""
+    env_dir = os.path.join(VENV_DIR, env_name)
+    if os.name == "nt":
+        candidates = [os.path.join(env_dir, "Lib", "site-packages")]
+    else:
+        candidates = glob.glob(os.path.join(env_dir, "lib", "python*", "site-packages"))
+    for candidate in candidates:
+        if os.path.isdir(candidate):
+            return candidate
+    return None
+
 def list_packages(env_name):
     """
     List installed packages in the specified environment.
 
+    Reads the dist-info metadata in the environment's site-packages
+    directly, which avoids spawning a pip subprocess (~200-500 ms of
+    interpreter startup per call). Falls back to `pip list` if the
+    site-packages directory cannot be located.
+
     Args:
         env_name (str): Name of the environment.
 
     Returns:
         list: List of tuples containing (package_name, version).
     """
+    site_packages = _get_site_packages(env_name)
+    if site_packages is not None:
+        try:
+            packages = []
+            for dist in distributions(path=[site_packages]):
+                name = dist.metadata["Name"]
+                if name:
+                    packages.append((name, dist.version))
+            packages.sort(key=lambda item: item[0].lower())
+            return packages
+        except Exception as e:
+            logging.error(f"Metadata scan failed for {env_name}, falling back to pip: {e}")
+
     python_path = get_env_python(env_name)
     try:
-        # Log the command
-        
         result = subprocess.run([python_path, "-m", "pip", "list", "--format", "freeze"], capture_output=True, text=True, check=True)
         packages = []
         for line in result.stdout.strip().split("\n"):
@@ -256,7 +287,7 @@ def import_requirements(env_name, file_path, log_callback=None):
             
             output_lines = []
             process = subprocess.Popen(
-                [python_path, "-m", "pip", "install", "-r", file_path],
+                [python_path, "-m", "pip", "install", "-r", file_path, "--no-input"],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
                 text=True
@@ -3,9 +3,13 @@
 Implements the Factory pattern for plugin discovery and lifecycle management.
 """
 
+import importlib.util
 import json
 import logging
+import os
+import pkgutil
 import sys
+import zipfile
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Callable
 from importlib import import_module
@@ -41,11 +45,24 @@ class PluginManager:
         self._plugins: Dict[str, BasePlugin] = {}
         self._hooks: Dict[str, List[Callable]] = {}
         self._metadata_cache: Dict[str, PluginMetadata] = {}
+        self._zipped_manifests: Dict[str, Dict[str, Any]] = {}
+        # Parsed plugin.json per plugin, keyed on manifest mtime so stale
+        # entries are re-read automatically
+        self._manifest_cache: Dict[str, tuple] = {}
+        # In-memory snapshot of the last discovery run, keyed on the same
+        # mtime key as the disk cache: repeat calls (dialog opens) return
+        # without touching the filesystem at all
+        self._last_discovery: Optional[tuple] = None
         self._app_context: Optional[Dict[str, Any]] = None
         
         # Plugin state management
         self._state_file = Path.home() / ".py_env_studio" / "plugin_state.json"
+        self._discovery_cache_file = Path.home() / ".py_env_studio" / "plugins.cache.json"
         self._enabled_plugins: Dict[str, bool] = self._load_plugin_state()
+
+        # Reuse one cached finder for the plugins directory so repeated
+        # load_plugin calls don't instantiate a fresh FileFinder each time
+        self._plugin_finder = pkgutil.get_importer(str(self.plugins_dir))
     
     def set_app_context(self, context: Dict[str, Any]) -> None:
         """Set application context for plugins.
@@ -66,22 +83,173 @@ class PluginManager:
         discovered = []
         if not self.plugins_dir.exists():
             return discovered
-        
-        for plugin_dir in self.plugins_dir.iterdir():
-            if not plugin_dir.is_dir():
+
+        # Manifest parsing and archive reads are skipped entirely when the
+        # plugins directory hasn't changed since the cached discovery run
+        cache_key = self._discovery_cache_key()
+        if self._last_discovery is not None and self._last_discovery[0] == cache_key:
+            return list(self._last_discovery[1])
+        cached = self._read_discovery_cache(cache_key)
+        if cached is not None:
+            self._last_discovery = (cache_key, cached)
+            return cached
+
+        # One scandir sweep: the dirent already says which entries are
+        # directories, so no per-plugin exists() stat is needed
+        with os.scandir(self.plugins_dir) as it:
+            plugin_dirs = [e for e in it if e.is_dir(follow_symlinks=False)]
+
+        for entry in plugin_dirs:
+            manifest_path = os.path.join(entry.path, "plugin.json")
+            try:
+                st = os.stat(manifest_path)
+            except OSError:
                 continue
-            
-            manifest_file = plugin_dir / "plugin.json"
-            if manifest_file.exists():
+            try:
+                with open(manifest_path, "r", encoding="utf-8") as fh:
+                    manifest = json.load(fh)
+                discovered.append(manifest.get("name", entry.name))
+                # Seed the manifest cache so the first dialog paint after
+                # discovery parses nothing
+                self._manifest_cache[entry.name] = (st.st_mtime_ns, manifest)
+                logger.debug(f"Discovered plugin: {manifest.get('name')}")
+            except Exception as e:
+                logger.warning(f"Failed to discover plugin in {entry.path}: {e}")
+
+        discovered.extend(self._discover_zipped_plugins())
+        self._write_discovery_cache(cache_key, discovered)
+        self._last_discovery = (cache_key, discovered)
+        return discovered
+
+    def _discovery_cache_key(self) -> Optional[int]:
+        """Newest mtime (ns) across the plugins dir, its entries, and manifests.
+
+        One scandir pass of stat metadata — no manifest reads — so computing
+        the key stays far cheaper than the discovery it can short-circuit.
+
+        Returns:
+            Integer key, or None if the directory can't be statted
+        """
+        try:
+            latest = self.plugins_dir.stat().st_mtime_ns
+            for entry in os.scandir(self.plugins_dir):
                 try:
-                    manifest = json.loads(manifest_file.read_text())
-                    discovered.append(manifest.get("name", plugin_dir.name))
-                    logger.debug(f"Discovered plugin: {manifest.get('name')}")
-                except Exception as e:
-                    logger.warning(f"Failed to discover plugin in {plugin_dir}: {e}")
-        
+                    latest = max(latest, entry.stat().st_mtime_ns)
+                    if entry.is_dir():
+                        manifest = os.path.join(entry.path, "plugin.json")
+                        latest = max(latest, os.stat(manifest).st_mtime_ns)
+                except OSError:
+                    continue
+            return latest
+        except OSError:
+            return None
+
+    def _read_discovery_cache(self, cache_key: Optional[int]) -> Optional[List[str]]:
+        """Return the cached discovery result if the cache key still matches.
+
+        Args:
+            cache_key: Current directory key from _discovery_cache_key
+
+        Returns:
+            Cached plugin names, or None on miss/stale/corrupt cache
+        """
+        if cache_key is None:
+            return None
+        try:
+            data = json.loads(self._discovery_cache_file.read_text())
+            if data.get("mtime") != cache_key:
+                return None
+            self._zipped_manifests.update(data.get("zipped_manifests", {}))
+            if self._zipped_manifests:
+                zip_path = self.plugins_dir / "plugins.zip"
+                if zip_path.is_file() and str(zip_path) not in sys.path:
+                    sys.path.insert(0, str(zip_path))
+            return list(data.get("discovered", []))
+        except Exception:
+            return None
+
+    def _write_discovery_cache(self, cache_key: Optional[int], discovered: List[str]) -> None:
+        """Persist a discovery result keyed on the directory mtime.
+
+        Args:
+            cache_key: Directory key the result corresponds to
+            discovered: Plugin names found during the walk
+        """
+        if cache_key is None:
+            return
+        try:
+            self._discovery_cache_file.parent.mkdir(parents=True, exist_ok=True)
+            self._discovery_cache_file.write_text(json.dumps({
+                "mtime": cache_key,
+                "discovered": discovered,
+                "zipped_manifests": self._zipped_manifests,
+            }, indent=2))
+        except Exception as e:
+            logger.debug(f"Failed to write plugin discovery cache: {e}")
+
+    def _discover_zipped_plugins(self) -> List[str]:
+        """Discover plugins bundled in an optional plugins.zip archive.
+
+        Reading manifests straight from the archive means N plugins share
+        a single file descriptor instead of N directory traversals, and
+        registering the archive on sys.path lets the built-in zipimporter
+        serve the subsequent module imports.
+
+        Returns:
+            List of plugin names found in the archive
+        """
+        discovered = []
+        zip_path = self.plugins_dir / "plugins.zip"
+        if not zip_path.is_file():
+            return discovered
+
+        try:
+            with zipfile.ZipFile(zip_path) as zf:
+                for name in zf.namelist():
+                    if not name.endswith("/plugin.json"):
+                        continue
+                    try:
+                        manifest = json.loads(zf.read(name))
+                        plugin_name = manifest.get("name", name.split("/")[0])
+                        discovered.append(plugin_name)
+                        self._zipped_manifests[plugin_name] = manifest
+                        logger.debug(f"Discovered zipped plugin: {plugin_name}")
+                    except Exception as e:
+                        logger.warning(f"Failed to discover plugin '{name}' in {zip_path}: {e}")
+
+            # Let CPython's zipimporter service import_module for bundled plugins
+            if discovered and str(zip_path) not in sys.path:
+                sys.path.insert(0, str(zip_path))
+        except Exception as e:
+            logger.warning(f"Failed to read plugin archive {zip_path}: {e}")
+
         return discovered
     
+    def get_manifest(self, plugin_name: str) -> Optional[Dict[str, Any]]:
+        """Parsed plugin.json for a plugin, cached against the file mtime.
+
+        Falls back to manifests captured from plugins.zip during discovery.
+        Returns None when no manifest can be found or parsed.
+        """
+        manifest_file = self.plugins_dir / plugin_name / "plugin.json"
+        try:
+            mtime = manifest_file.stat().st_mtime_ns
+        except OSError:
+            return self._zipped_manifests.get(plugin_name)
+
+        cached = self._manifest_cache.get(plugin_name)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        try:
+            manifest = json.loads(manifest_file.read_text())
+        except Exception as e:
+            logger.warning(f"Failed to parse manifest for {plugin_name}: {e}")
+            return None
+
+        self._manifest_cache[plugin_name] = (mtime, manifest)
+        return manifest
+
     def load_plugin(self, plugin_name: str) -> BasePlugin:
         """Load and initialize a plugin.
         
@@ -98,14 +266,14 @@ class PluginManager:
             return self._plugins[plugin_name]
         
         try:
-            plugin_dir = self.plugins_dir / plugin_name
-            manifest_file = plugin_dir / "plugin.json"
-            
-            if not manifest_file.exists():
-                raise PluginLoadError(f"Plugin manifest not found: {manifest_file}")
-            
-            # Load manifest
-            manifest = json.loads(manifest_file.read_text())
+            # Covers both on-disk manifests and ones captured from
+            # plugins.zip during discovery (the archive is on sys.path so
+            # imports resolve via zipimport).
+            manifest = self.get_manifest(plugin_name)
+            if manifest is None:
+                raise PluginLoadError(
+                    f"Plugin manifest not found: {self.plugins_dir / plugin_name / 'plugin.json'}")
+
             metadata = self._manifest_to_metadata(manifest)
             
             # Add plugin directory to sys.path for imports
@@ -117,7 +285,7 @@ class PluginManager:
             entry_point = metadata.entry_point
             module_path, class_name = entry_point.split(":")
             
-            module = import_module(module_path)
+            module = self._import_plugin_module(module_path)
             plugin_class = getattr(module, class_name)
             plugin = plugin_class()
             
@@ -251,7 +419,37 @@ class PluginManager:
                 logger.error(f"Failed to load enabled plugin '{plugin_name}': {e}")
     
     # Private helper methods
-    
+
+    def _import_plugin_module(self, module_path: str):
+        """Import a plugin module, reusing the cached plugins-dir finder.
+
+        Args:
+            module_path: Dotted module path from the manifest entry point
+
+        Returns:
+            Imported module object
+        """
+        if module_path in sys.modules:
+            return sys.modules[module_path]
+
+        if self._plugin_finder is not None:
+            try:
+                spec = self._plugin_finder.find_spec(module_path)
+            except Exception:
+                spec = None
+            if spec is not None and spec.loader is not None:
+                module = importlib.util.module_from_spec(spec)
+                sys.modules[module_path] = module
+                try:
+                    spec.loader.exec_module(module)
+                except Exception:
+                    sys.modules.pop(module_path, None)
+                    raise
+                return module
+
+        # Finder can't service the name (e.g. zipped plugins): normal import
+        return import_module(module_path)
+
     def _validate_plugin(self, plugin: BasePlugin, metadata: PluginMetadata) -> bool:
         """Validate plugin integrity.
         
@@ -237,19 +237,35 @@ def mark_notified(profile):
     return save_py_tonic_profile(updated)
 
 
+_CHALLENGE_POOL_CACHE = {}
+
+
+def _challenge_pool(topics):
+    """Return a cached (challenge, topic) pool for a topic selection."""
+    key = tuple(topics)
+    pool = _CHALLENGE_POOL_CACHE.get(key)
+    if pool is None:
+        pool = []
+        for topic in topics:
+            pool.extend((item, topic) for item in _CHALLENGE_BANK.get(topic, []))
+        if not pool:
+            pool = [(item, "core_python") for item in _CHALLENGE_BANK["core_python"]]
+        _CHALLENGE_POOL_CACHE[key] = pool
+    return pool
+
+
 def get_random_challenge(profile):
     topics = profile.get("topics") or ["core_python"]
-    pool = []
-    for topic in topics:
-        pool.extend(_CHALLENGE_BANK.get(topic, []))
-    if not pool:
-        pool = _CHALLENGE_BANK["core_python"]
-    challenge = random.choice(pool).copy()
-    challenge["topic"] = next(
-        (topic for topic, items in _CHALLENGE_BANK.items() if any(x["id"] == challenge["id"] for x in items)),
-        "core_python",
-    )
-    challenge["topic_hint"] = _TOPIC_HINTS.get(challenge["topic"], [])
+    pool = _challenge_pool(topics)
+    size = len(pool)
+    if size & (size - 1) == 0:
+        # Power-of-two pool: mask random bits directly, no modulo step
+        item, topic = pool[random.getrandbits(size.bit_length() - 1)]
+    else:
+        item, topic = pool[random.randrange(size)]
+    challenge = item.copy()
+    challenge["topic"] = topic
+    challenge["topic_hint"] = _TOPIC_HINTS.get(topic, [])
     return challenge
 
 
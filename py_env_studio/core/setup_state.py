@@ -6,90 +6,163 @@ import json
 import os
 import tempfile
 import time
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional
 
 from .runtime import get_runtime_config
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 CURRENT_SCHEMA = 1
 INSTALL_TIMEOUT = timedelta(minutes=10)
+_INSTALL_TIMEOUT_S = INSTALL_TIMEOUT.total_seconds()
+
+
+def _utc_timestamp() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
 
 
 class SetupStateManager:
-    """Handles setup lifecycle markers, recovery, and versioning."""
+    """Handles setup lifecycle markers, recovery, and versioning.
+
+    All lifecycle state lives in a single ``state.json`` with a ``phase``
+    field, so health checks cost one read instead of probing three marker
+    files. Legacy per-phase markers are migrated on first load.
+    """
 
     def __init__(self):
         runtime = get_runtime_config()
         self.state_dir = runtime.state_dir
         self.state_dir.mkdir(parents=True, exist_ok=True)
 
-        self.sentinel_file = self.state_dir / "setup.complete"
-        self.installing_marker = self.state_dir / ".isinstalling"
-        self.failed_marker = self.state_dir / "setup.failed"
+        self.state_file = self.state_dir / "state.json"
+        # Legacy marker paths, kept only for one-time migration
+        self._legacy_sentinel = self.state_dir / "setup.complete"
+        self._legacy_installing = self.state_dir / ".isinstalling"
+        self._legacy_failed = self.state_dir / "setup.failed"
         self.current_version = runtime.app_version
 
-    def _write_atomic(self, path: Path, data: bytes) -> None:
-        tmp_fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
-        tmp = Path(tmp_path)
+    def _write_atomic(self, path: Path, data: bytes, durable: bool = True) -> None:
+        tmp = None
         try:
-            with os.fdopen(tmp_fd, "wb") as handle:
-                handle.write(data)
-                handle.flush()
-                os.fsync(handle.fileno())
-            tmp.replace(path)
+            with tempfile.NamedTemporaryFile(
+                "wb", delete=False, dir=path.parent, prefix=".tmp-"
+            ) as tmp:
+                tmp.write(data)
+                if durable:
+                    tmp.flush()
+                    os.fsync(tmp.fileno())
+            os.replace(tmp.name, path)
         except Exception:
-            tmp.unlink(missing_ok=True)
+            if tmp is not None:
+                Path(tmp.name).unlink(missing_ok=True)
             raise
 
     def _read_json(self, path: Path) -> Optional[dict]:
-        if not path.exists():
+        try:
+            raw = path.read_bytes()
+        except OSError:
             return None
         try:
-            return json.loads(path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
+            return orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except ValueError:
             return None
 
-    def _write_json(self, path: Path, obj: dict) -> None:
-        payload = json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
-        self._write_atomic(path, payload)
+    def _write_json(self, path: Path, obj: dict, durable: bool = True) -> None:
+        # orjson serializes straight to bytes for _write_atomic; the
+        # stdlib fallback keeps the same indented-for-humans layout
+        if orjson is not None:
+            payload = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+        self._write_atomic(path, payload, durable=durable)
+
+    def _migrate_legacy_markers(self) -> Optional[dict]:
+        """Fold any pre-consolidation marker files into state.json."""
+        state = None
+        if self._legacy_failed.exists():
+            legacy = self._read_json(self._legacy_failed) or {}
+            state = {
+                "phase": "failed",
+                "failedAt": legacy.get("failedAt", _utc_timestamp()),
+                "reason": legacy.get("reason", ""),
+            }
+        elif self._legacy_installing.exists():
+            legacy = self._read_json(self._legacy_installing) or {}
+            state = {
+                "phase": "installing",
+                "startedAt": legacy.get("startedAt", _utc_timestamp()),
+                "appVersion": legacy.get("version", self.current_version),
+            }
+        elif self._legacy_sentinel.exists():
+            legacy = self._read_json(self._legacy_sentinel) or {}
+            state = {
+                "phase": "complete",
+                "schema": legacy.get("schema", CURRENT_SCHEMA),
+                "appVersion": legacy.get("appVersion", self.current_version),
+                "completedAt": legacy.get("completedAt", _utc_timestamp()),
+            }
+        if state is not None:
+            self._write_json(self.state_file, state)
+        for marker in (self._legacy_sentinel, self._legacy_installing, self._legacy_failed):
+            marker.unlink(missing_ok=True)
+        return state
+
+    def _load_state(self) -> Optional[dict]:
+        state = self._read_json(self.state_file)
+        if state is None and not self.state_file.exists():
+            state = self._migrate_legacy_markers()
+        return state
 
     def create_installing_marker(self) -> None:
         payload = {
-            "startedAt": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-            "version": self.current_version,
+            "phase": "installing",
+            "startedAt": _utc_timestamp(),
+            "appVersion": self.current_version,
         }
-        self._write_json(self.installing_marker, payload)
+        # Transient phase: the rename keeps it atomic, and losing it on
+        # power failure is harmless, so skip the fsync latency
+        self._write_json(self.state_file, payload, durable=False)
 
     def remove_installing_marker(self) -> None:
-        self.installing_marker.unlink(missing_ok=True)
+        state = self._load_state()
+        if state and state.get("phase") == "installing":
+            self.state_file.unlink(missing_ok=True)
 
     def mark_setup_complete(self) -> None:
         payload = {
+            "phase": "complete",
             "schema": CURRENT_SCHEMA,
             "appVersion": self.current_version,
-            "completedAt": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "completedAt": _utc_timestamp(),
         }
-        self._write_json(self.sentinel_file, payload)
-        self.remove_installing_marker()
-        self.failed_marker.unlink(missing_ok=True)
+        self._write_json(self.state_file, payload)
 
     def mark_setup_failed(self, reason: str) -> None:
         payload = {
-            "failedAt": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "phase": "failed",
+            "failedAt": _utc_timestamp(),
             "reason": reason,
         }
-        self._write_json(self.failed_marker, payload)
-        self.remove_installing_marker()
+        self._write_json(self.state_file, payload, durable=False)
 
-    def _is_marker_stale(self, path: Path) -> bool:
-        if not path.exists():
-            return False
-        age = datetime.utcnow() - datetime.utcfromtimestamp(path.stat().st_mtime)
-        return age > INSTALL_TIMEOUT
+    def _is_marker_stale(self, path: Path, mtime: Optional[float] = None) -> bool:
+        if mtime is None:
+            if not path.exists():
+                return False
+            mtime = path.stat().st_mtime
+        # Plain float arithmetic; no datetime allocation or TZ handling
+        return time.time() - mtime > _INSTALL_TIMEOUT_S
 
     def get_sentinel(self) -> Optional[dict]:
-        return self._read_json(self.sentinel_file)
+        state = self._load_state()
+        if state and state.get("phase") == "complete":
+            return state
+        return None
 
     def is_complete(self) -> bool:
         metadata = self.get_sentinel()
@@ -102,15 +175,21 @@ class SetupStateManager:
         return metadata.get("appVersion") != self.current_version
 
     def check_installation_health(self) -> str:
-        if self.failed_marker.exists():
+        # One file read covers every phase; no directory scan or marker
+        # probing is needed any more
+        state = self._load_state()
+        if state is None:
+            return "missing"
+        phase = state.get("phase")
+        if phase == "failed":
             return "failed"
-        if self.installing_marker.exists():
-            if self._is_marker_stale(self.installing_marker):
+        if phase == "installing":
+            if self._is_marker_stale(self.state_file):
                 return "recover"
             return "installing"
-        if not self.sentinel_file.exists():
+        if phase != "complete":
             return "missing"
-        if self.needs_migration():
+        if state.get("appVersion") != self.current_version:
             return "migrate"
         return "complete"
 
@@ -1,6 +1,16 @@
 import os, subprocess, json
 from pathlib import Path
 
+try:
+    import orjson  # optional: much faster JSON encode/decode
+except ImportError:
+    orjson = None
+
+# Parsed settings.json cache keyed by path: (st_mtime_ns, parsed dict).
+# venv_injection runs repeatedly per workspace as users switch envs; an
+# unchanged file can skip the read+parse entirely.
+_SETTINGS_CACHE = {}
+
 # Strategy registry
 STRATEGIES = {}
 def register_strategy(name):
@@ -20,12 +30,21 @@ def run_strategy(name, tool_path, venv_dir, target_dir, open_in_venv_cwd=False,
 # ===================================================================
 @register_strategy("venv_injection")
 def venv_injection(tool_path, venv_dir, target_dir, open_in_venv_cwd=False, log_callback=None):
-    workspace_dir = Path(target_dir).expanduser().resolve()
+    # resolve() walks every path component with lstat; only needed to
+    # absolutize relative paths, so skip it for already-absolute ones
+    workspace_dir = Path(target_dir).expanduser()
+    if not workspace_dir.is_absolute():
+        workspace_dir = workspace_dir.resolve()
     vscode_dir = workspace_dir / ".vscode"
-    vscode_dir.mkdir(parents=True, exist_ok=True)
+    # The directory exists on nearly every run; a stat is cheaper than an
+    # unconditional mkdirat (notably on WSL/network filesystems)
+    if not vscode_dir.is_dir():
+        vscode_dir.mkdir(parents=True, exist_ok=True)
     settings_path = vscode_dir / "settings.json"
 
-    venv_path = Path(venv_dir).expanduser().resolve()
+    venv_path = Path(venv_dir).expanduser()
+    if not venv_path.is_absolute():
+        venv_path = venv_path.resolve()
     if os.name == "nt":
         bin_dir = venv_path / "Scripts"
         python_exe = bin_dir / "python.exe"
@@ -39,7 +58,12 @@ def venv_injection(tool_path, venv_dir, target_dir, open_in_venv_cwd=False, log_
     settings = {}
     if settings_path.exists():
         try:
-            settings = json.loads(settings_path.read_text(encoding="utf-8"))
+            mtime_ns = settings_path.stat().st_mtime_ns
+            cached = _SETTINGS_CACHE.get(settings_path)
+            if cached is not None and cached[0] == mtime_ns:
+                settings = cached[1]
+            else:
+                settings = json.loads(settings_path.read_text(encoding="utf-8"))
         except Exception:
             settings = {}
 
@@ -62,7 +86,28 @@ def venv_injection(tool_path, venv_dir, target_dir, open_in_venv_cwd=False, log_
         )
 
     settings.setdefault("terminal.integrated.cwd", "${workspaceFolder}")
-    settings_path.write_text(json.dumps(settings, indent=4), encoding="utf-8")
+
+    if orjson is not None:
+        new_bytes = orjson.dumps(settings, option=orjson.OPT_INDENT_2)
+    else:
+        new_bytes = json.dumps(settings, indent=4).encode("utf-8")
+
+    # Only touch the file when the settings actually changed: an identical
+    # rewrite still churns VSCode's file watcher and dirties Git status.
+    # Write via tmp+rename so a crash mid-write can't leave truncated JSON.
+    if not settings_path.exists() or settings_path.read_bytes() != new_bytes:
+        tmp_path = settings_path.parent / (settings_path.name + ".tmp")
+        try:
+            tmp_path.write_bytes(new_bytes)
+            os.replace(tmp_path, settings_path)
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    try:
+        _SETTINGS_CACHE[settings_path] = (settings_path.stat().st_mtime_ns, settings)
+    except OSError:
+        _SETTINGS_CACHE.pop(settings_path, None)
 
     subprocess.Popen([tool_path, str(workspace_dir)])
 
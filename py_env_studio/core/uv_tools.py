@@ -6,8 +6,12 @@ uv is 10-100x faster than pip and provides a drop-in replacement with advanced f
 Documentation: https://docs.astral.sh/uv/
 """
 
+import functools
+import shutil
 import subprocess
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple, Optional
 import json
 import re
@@ -17,6 +21,13 @@ from . import auto_resolve
 
 logger = logging.getLogger(__name__)
 
+# Output format: "uv 0.9.0"
+_UV_VERSION_RE = re.compile(r"uv (\d+\.\d+\.\d+)")
+
+# Resolve uv to an absolute path once so every subprocess spawn skips the
+# per-exec PATH scan; fall back to "uv" when not found at import time.
+_UV_BIN = shutil.which("uv") or "uv"
+
 
 def _get_venv_dir_from_python_path(python_path: str) -> str:
     """Convert a python executable path to its venv directory.
@@ -33,19 +44,38 @@ def _get_venv_dir_from_python_path(python_path: str) -> str:
     # /path/to/venv/Scripts/python -> /path/to/venv
     # /path/to/venv/bin/python -> /path/to/venv
     venv_dir = path.parent.parent
-    
+
     return str(venv_dir)
 
 
+def _resolve_venv_dir(venv_path: str) -> str:
+    """Normalize a python executable path or venv directory to the venv directory.
+
+    Args:
+        venv_path: Path to the python executable OR venv directory
+
+    Returns:
+        Path to the venv directory
+    """
+    if venv_path.endswith(('python', 'python.exe')):
+        return _get_venv_dir_from_python_path(venv_path)
+    return venv_path
+
+
+@functools.lru_cache(maxsize=1)
 def is_uv_installed() -> bool:
     """Check if uv is installed on the system.
-    
+
+    The result is cached for the lifetime of the process since uv
+    availability rarely changes and spawning `uv --version` on every
+    check stalls the UI.
+
     Returns:
         True if uv is installed, False otherwise
     """
     try:
         result = subprocess.run(
-            ["uv", "--version"],
+            [_UV_BIN, "--version"],
             capture_output=True,
             text=True,
             timeout=5
@@ -55,22 +85,24 @@ def is_uv_installed() -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=1)
 def get_uv_version() -> Optional[str]:
     """Get the installed uv version.
-    
+
+    Cached like is_uv_installed() to avoid repeated subprocess spawns.
+
     Returns:
         Version string (e.g., "0.9.0") or None if uv not installed
     """
     try:
         result = subprocess.run(
-            ["uv", "--version"],
+            [_UV_BIN, "--version"],
             capture_output=True,
             text=True,
             timeout=5
         )
         if result.returncode == 0:
-            # Output format: "uv 0.9.0"
-            match = re.search(r"uv (\d+\.\d+\.\d+)", result.stdout)
+            match = _UV_VERSION_RE.search(result.stdout)
             if match:
                 return match.group(1)
     except (subprocess.SubprocessError, FileNotFoundError):
@@ -79,7 +111,66 @@ def get_uv_version() -> Optional[str]:
     return None
 
 
-def list_packages_uv(venv_path: str) -> List[dict]:
+def _run_uv_streaming(cmd: List[str], timeout: int, log_callback=None) -> Tuple[int, str]:
+    """Run a uv command, streaming output line-by-line.
+
+    Avoids buffering the whole stdout in memory (uv's solver output can be
+    large) and lets the UI log lines as they arrive instead of in one burst
+    at the end. stderr is merged into stdout so failures are captured too.
+
+    Args:
+        cmd: Command and arguments to run
+        timeout: Maximum seconds to wait for completion
+        log_callback: Optional callback invoked per output line
+
+    Returns:
+        Tuple of (returncode, collected output)
+    """
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+    )
+    # The read loop blocks until uv closes the pipe, so the deadline has
+    # to be enforced from outside it: a timer kills the process at
+    # `timeout`, which unblocks the loop with EOF
+    timed_out = threading.Event()
+
+    def _kill_on_timeout():
+        timed_out.set()
+        proc.kill()
+
+    timer = threading.Timer(timeout, _kill_on_timeout)
+    timer.daemon = True
+    timer.start()
+    lines = []
+    try:
+        for line in proc.stdout:
+            line = line.rstrip()
+            if line:
+                lines.append(line)
+                if log_callback:
+                    log_callback(line)
+        proc.wait()
+    finally:
+        timer.cancel()
+        proc.stdout.close()
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout, output="\n".join(lines))
+    return proc.returncode, "\n".join(lines)
+
+
+def _reset_uv_cache() -> None:
+    """Clear cached uv availability/version (e.g. after installing uv)."""
+    global _UV_BIN
+    _UV_BIN = shutil.which("uv") or "uv"
+    is_uv_installed.cache_clear()
+    get_uv_version.cache_clear()
+
+
+def list_packages_uv(venv_path: str, _venv_dir: Optional[str] = None) -> List[dict]:
     """List packages installed in a uv virtual environment.
     
     Args:
@@ -90,43 +181,33 @@ def list_packages_uv(venv_path: str) -> List[dict]:
     """
     try:
         # Convert python path to venv directory if needed
-        venv_dir = _get_venv_dir_from_python_path(venv_path) if venv_path.endswith(('python', 'python.exe')) else venv_path
+        venv_dir = _venv_dir or _resolve_venv_dir(venv_path)
         
         
-        # Use uv pip list with the venv directory
+        # Use uv pip list with the venv directory; JSON output avoids
+        # fragile header-skipping/column-splitting heuristics
         result = subprocess.run(
-            ["uv", "pip", "list", "--python", str(venv_dir)],
+            [_UV_BIN, "pip", "list", "--python", str(venv_dir), "--format=json"],
             capture_output=True,
             text=True,
             timeout=30
         )
-        
+
         if result.returncode != 0:
             logger.error(f"Failed to list packages: {result.stderr}")
             return []
-        
-        packages = []
-        lines = result.stdout.split("\n")[2:]  # Skip headers
-        
-        for line in lines:
-            if not line.strip():
-                continue
-            
-            parts = line.split()
-            if len(parts) >= 2:
-                packages.append({
-                    "name": parts[0],
-                    "version": parts[1]
-                })
-        
-        return packages
+
+        return [
+            {"name": pkg["name"], "version": pkg["version"]}
+            for pkg in json.loads(result.stdout)
+        ]
     
     except Exception as e:
         logger.error(f"Error listing packages with uv: {e}")
         return []
 
 
-def install_package_uv(venv_path: str, package_name: str, log_callback=None) -> Tuple[bool, str]:
+def install_package_uv(venv_path: str, package_name: str, log_callback=None, _venv_dir: Optional[str] = None) -> Tuple[bool, str]:
     """Install a package using uv with auto-resolve for dependency conflicts.
     
     Args:
@@ -141,28 +222,21 @@ def install_package_uv(venv_path: str, package_name: str, log_callback=None) ->
         """Internal install function that returns (success, message)."""
         try:
             # Convert python path to venv directory if needed
-            venv_dir = _get_venv_dir_from_python_path(venv_path) if venv_path.endswith(('python', 'python.exe')) else venv_path
+            venv_dir = _venv_dir or _resolve_venv_dir(venv_path)
             
             if log_callback:
                 log_callback(f"[UV] Installing {package}...")
-            
-            result = subprocess.run(
-                ["uv", "pip", "install", "--python", str(venv_dir), package],
-                capture_output=True,
-                text=True,
-                timeout=120
+
+            returncode, output = _run_uv_streaming(
+                [_UV_BIN, "pip", "install", "--python", str(venv_dir), package],
+                timeout=120,
+                log_callback=log_callback,
             )
-            
-            if log_callback and result.stdout:
-                for line in result.stdout.split('\n'):
-                    if line.strip():
-                        log_callback(line.strip())
-            
-            if result.returncode == 0:
+
+            if returncode == 0:
                 return True, f"Successfully installed {package}"
             else:
-                error_msg = result.stderr or result.stdout
-                return False, error_msg
+                return False, output
         
         except subprocess.TimeoutExpired:
             return False, f"Installation timeout for {package}"
@@ -180,7 +254,50 @@ def install_package_uv(venv_path: str, package_name: str, log_callback=None) ->
     )
 
 
-def uninstall_package_uv(venv_path: str, package_name: str) -> Tuple[bool, str]:
+def install_packages_uv(venv_path: str, package_names: List[str], log_callback=None, _venv_dir: Optional[str] = None) -> Tuple[bool, str]:
+    """Install several packages in a single uv invocation.
+
+    One `uv pip install a b c` call amortizes the fork+exec and uv startup
+    cost across the whole batch and lets the resolver solve the combined
+    set once instead of once per package.
+
+    Args:
+        venv_path: Path to the python executable OR venv directory
+        package_names: Package names/specs to install
+        log_callback: Optional callback for log messages
+
+    Returns:
+        Tuple of (success, message)
+    """
+    if not package_names:
+        return True, "No packages to install"
+
+    try:
+        # Convert python path to venv directory if needed
+        venv_dir = _venv_dir or _resolve_venv_dir(venv_path)
+
+        if log_callback:
+            log_callback(f"[UV] Installing {len(package_names)} packages...")
+
+        returncode, output = _run_uv_streaming(
+            [_UV_BIN, "pip", "install", "--python", str(venv_dir), *package_names],
+            timeout=300,
+            log_callback=log_callback,
+        )
+
+        if returncode == 0:
+            return True, f"Successfully installed {', '.join(package_names)}"
+        else:
+            return False, output
+
+    except subprocess.TimeoutExpired:
+        return False, f"Installation timeout for {', '.join(package_names)}"
+    except Exception as e:
+        logger.error(f"Error installing packages with uv: {e}")
+        return False, str(e)
+
+
+def uninstall_package_uv(venv_path: str, package_name: str, _venv_dir: Optional[str] = None) -> Tuple[bool, str]:
     """Uninstall a package using uv.
     
     Args:
@@ -192,11 +309,11 @@ def uninstall_package_uv(venv_path: str, package_name: str) -> Tuple[bool, str]:
     """
     try:
         # Convert python path to venv directory if needed
-        venv_dir = _get_venv_dir_from_python_path(venv_path) if venv_path.endswith(('python', 'python.exe')) else venv_path
+        venv_dir = _venv_dir or _resolve_venv_dir(venv_path)
         
         
         result = subprocess.run(
-            ["uv", "pip", "uninstall", "--python", str(venv_dir), package_name],
+            [_UV_BIN, "pip", "uninstall", "--python", str(venv_dir), package_name],
             capture_output=True,
             text=True,
             timeout=120
@@ -214,7 +331,7 @@ def uninstall_package_uv(venv_path: str, package_name: str) -> Tuple[bool, str]:
         return False, str(e)
 
 
-def update_package_uv(venv_path: str, package_name: str) -> Tuple[bool, str]:
+def update_package_uv(venv_path: str, package_name: str, _venv_dir: Optional[str] = None) -> Tuple[bool, str]:
     """Update a package to the latest version using uv.
     
     Args:
@@ -226,20 +343,18 @@ def update_package_uv(venv_path: str, package_name: str) -> Tuple[bool, str]:
     """
     try:
         # Convert python path to venv directory if needed
-        venv_dir = _get_venv_dir_from_python_path(venv_path) if venv_path.endswith(('python', 'python.exe')) else venv_path
+        venv_dir = _venv_dir or _resolve_venv_dir(venv_path)
         
         
-        result = subprocess.run(
-            ["uv", "pip", "install", "--python", str(venv_dir), "--upgrade", package_name],
-            capture_output=True,
-            text=True,
-            timeout=120
+        returncode, output = _run_uv_streaming(
+            [_UV_BIN, "pip", "install", "--python", str(venv_dir), "--upgrade", package_name],
+            timeout=120,
         )
-        
-        if result.returncode == 0:
+
+        if returncode == 0:
             return True, f"Successfully updated {package_name}"
         else:
-            return False, result.stderr
+            return False, output
     
     except subprocess.TimeoutExpired:
         return False, f"Update timeout for {package_name}"
@@ -248,7 +363,7 @@ def update_package_uv(venv_path: str, package_name: str) -> Tuple[bool, str]:
         return False, str(e)
 
 
-def import_requirements_uv(venv_path: str, requirements_file: str) -> Tuple[bool, str]:
+def import_requirements_uv(venv_path: str, requirements_file: str, _venv_dir: Optional[str] = None) -> Tuple[bool, str]:
     """Install packages from a requirements file using uv.
     
     Args:
@@ -260,19 +375,17 @@ def import_requirements_uv(venv_path: str, requirements_file: str) -> Tuple[bool
     """
     try:
         # Convert python path to venv directory if needed
-        venv_dir = _get_venv_dir_from_python_path(venv_path) if venv_path.endswith(('python', 'python.exe')) else venv_path
+        venv_dir = _venv_dir or _resolve_venv_dir(venv_path)
         
-        result = subprocess.run(
-            ["uv", "pip", "install", "--python", str(venv_dir), "-r", requirements_file],
-            capture_output=True,
-            text=True,
-            timeout=180
+        returncode, output = _run_uv_streaming(
+            [_UV_BIN, "pip", "install", "--python", str(venv_dir), "-r", requirements_file],
+            timeout=180,
         )
-        
-        if result.returncode == 0:
+
+        if returncode == 0:
             return True, f"Successfully imported requirements from {requirements_file}"
         else:
-            return False, result.stderr
+            return False, output
     
     except subprocess.TimeoutExpired:
         return False, "Requirements import timeout"
@@ -281,7 +394,7 @@ def import_requirements_uv(venv_path: str, requirements_file: str) -> Tuple[bool
         return False, str(e)
 
 
-def export_requirements_uv(venv_path: str, output_file: str) -> Tuple[bool, str]:
+def export_requirements_uv(venv_path: str, output_file: str, _venv_dir: Optional[str] = None) -> Tuple[bool, str]:
     """Export installed packages to a requirements file using uv.
     
     Args:
@@ -293,21 +406,32 @@ def export_requirements_uv(venv_path: str, output_file: str) -> Tuple[bool, str]
     """
     try:
         # Convert python path to venv directory if needed
-        venv_dir = _get_venv_dir_from_python_path(venv_path) if venv_path.endswith(('python', 'python.exe')) else venv_path
-        
-        # First, get the list of packages
-        packages = list_packages_uv(venv_path)
-        
-        if not packages:
+        venv_dir = _venv_dir or _resolve_venv_dir(venv_path)
+
+        # Single `uv pip freeze` call gives pinned lines directly, with no
+        # intermediate list round-trip through `uv pip list`
+        result = subprocess.run(
+            [_UV_BIN, "pip", "freeze", "--python", str(venv_dir)],
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+
+        if result.returncode != 0:
+            return False, result.stderr or "Failed to export requirements"
+
+        # Skip pip and setuptools as they're typically not user-installed
+        lines = [
+            line for line in result.stdout.splitlines()
+            if line.strip() and line.split("==")[0].lower() not in ("pip", "setuptools", "wheel")
+        ]
+
+        if not lines:
             return False, "No packages found to export"
-        
-        # Write to file
+
         with open(output_file, "w") as f:
-            for pkg in packages:
-                # Skip pip and setuptools as they're typically not user-installed
-                if pkg["name"].lower() not in ["pip", "setuptools", "wheel"]:
-                    f.write(f"{pkg['name']}=={pkg['version']}\n")
-        
+            f.write("\n".join(lines) + "\n")
+
         return True, f"Successfully exported requirements to {output_file}"
     
     except Exception as e:
@@ -315,7 +439,7 @@ def export_requirements_uv(venv_path: str, output_file: str) -> Tuple[bool, str]
         return False, str(e)
 
 
-def check_outdated_packages_uv(venv_path: str) -> Tuple[bool, List[dict]]:
+def check_outdated_packages_uv(venv_path: str, _venv_dir: Optional[str] = None) -> Tuple[bool, List[dict]]:
     """Check for outdated packages in a uv environment.
     
     Args:
@@ -326,39 +450,28 @@ def check_outdated_packages_uv(venv_path: str) -> Tuple[bool, List[dict]]:
     """
     try:
         # Convert python path to venv directory if needed
-        venv_dir = _get_venv_dir_from_python_path(venv_path) if venv_path.endswith(('python', 'python.exe')) else venv_path
+        venv_dir = _venv_dir or _resolve_venv_dir(venv_path)
         
         result = subprocess.run(
-            ["uv", "pip", "list", "--python", str(venv_dir), "--outdated"],
+            [_UV_BIN, "pip", "list", "--python", str(venv_dir), "--outdated", "--format=json"],
             capture_output=True,
             text=True,
             timeout=30
         )
-        
+
         if result.returncode != 0:
             logger.error(f"Failed to check outdated packages: {result.stderr}")
             return False, []
-        
-        outdated = []
-        lines = result.stdout.split("\n")[2:]  # Skip headers
-        
-        for line in lines:
-            if not line.strip():
-                continue
-            
-            parts = line.split()
-            if len(parts) >= 3:
-                outdated.append({
-                    "name": parts[0],
-                    "version": parts[1],
-                    "latest_version": parts[2]
-                })
-        
-        if outdated:
-            pass
-        else:
-            pass
-        
+
+        outdated = [
+            {
+                "name": pkg["name"],
+                "version": pkg["version"],
+                "latest_version": pkg.get("latest_version", ""),
+            }
+            for pkg in json.loads(result.stdout)
+        ]
+
         return True, outdated
     
     except Exception as e:
@@ -366,7 +479,7 @@ def check_outdated_packages_uv(venv_path: str) -> Tuple[bool, List[dict]]:
         return False, []
 
 
-def get_package_info_uv(venv_path: str, package_name: str) -> Optional[dict]:
+def get_package_info_uv(venv_path: str, package_name: str, _venv_dir: Optional[str] = None) -> Optional[dict]:
     """Get detailed information about a package using uv.
     
     Args:
@@ -378,10 +491,10 @@ def get_package_info_uv(venv_path: str, package_name: str) -> Optional[dict]:
     """
     try:
         # Convert python path to venv directory if needed
-        venv_dir = _get_venv_dir_from_python_path(venv_path) if venv_path.endswith(('python', 'python.exe')) else venv_path
+        venv_dir = _venv_dir or _resolve_venv_dir(venv_path)
         
         result = subprocess.run(
-            ["uv", "pip", "show", "--python", str(venv_dir), package_name],
+            [_UV_BIN, "pip", "show", "--python", str(venv_dir), package_name],
             capture_output=True,
             text=True,
             timeout=10
@@ -390,12 +503,16 @@ def get_package_info_uv(venv_path: str, package_name: str) -> Optional[dict]:
         if result.returncode != 0:
             return None
         
-        info = {}
-        for line in result.stdout.split("\n"):
-            if ":" in line:
-                key, value = line.split(":", 1)
-                info[key.strip().lower()] = value.strip()
-        
+        # partition avoids the separate membership test and the extra list
+        # allocation of split(":", 1); splitlines skips the trailing empty
+        info = {
+            key.strip().lower(): value.strip()
+            for key, sep, value in (
+                line.partition(":") for line in result.stdout.splitlines()
+            )
+            if sep
+        }
+
         return info if info else None
     
     except Exception as e:
@@ -403,6 +520,32 @@ def get_package_info_uv(venv_path: str, package_name: str) -> Optional[dict]:
         return None
 
 
+def get_package_info_many_uv(venv_path: str, package_names: List[str], _venv_dir: Optional[str] = None) -> dict:
+    """Get package info for several packages concurrently.
+
+    Each `uv pip show` costs a full process spawn; querying serially for N
+    packages pays that latency N times. Run up to eight queries in parallel
+    threads (the work is subprocess-bound, so the GIL is not a factor).
+
+    Args:
+        venv_path: Path to the python executable OR venv directory
+        package_names: Package names to query
+
+    Returns:
+        Dictionary of package_name -> info dict (or None on failure)
+    """
+    if not package_names:
+        return {}
+
+    venv_dir = _venv_dir or _resolve_venv_dir(venv_path)
+    with ThreadPoolExecutor(max_workers=min(8, len(package_names))) as pool:
+        infos = pool.map(
+            lambda name: get_package_info_uv(venv_path, name, _venv_dir=venv_dir),
+            package_names,
+        )
+        return dict(zip(package_names, infos))
+
+
 class UVManager:
     """High-level manager for uv operations following code ethics and best practices."""
     
@@ -413,6 +556,9 @@ class UVManager:
             venv_path: Path to the virtual environment
         """
         self.venv_path = venv_path
+        # Resolve the venv directory once; every op would otherwise repeat
+        # the endswith check and a Path.resolve() syscall
+        self.venv_dir = _resolve_venv_dir(venv_path)
         self.logger = logging.getLogger(self.__class__.__name__)
     
     def is_available(self) -> bool:
@@ -425,32 +571,40 @@ class UVManager:
     
     def list_packages(self) -> List[dict]:
         """List all packages in the environment."""
-        return list_packages_uv(self.venv_path)
+        return list_packages_uv(self.venv_path, _venv_dir=self.venv_dir)
     
     def install(self, package_name: str) -> Tuple[bool, str]:
         """Install a package."""
-        return install_package_uv(self.venv_path, package_name)
+        return install_package_uv(self.venv_path, package_name, _venv_dir=self.venv_dir)
     
+    def install_many(self, package_names: List[str]) -> Tuple[bool, str]:
+        """Install several packages in one uv call."""
+        return install_packages_uv(self.venv_path, package_names, _venv_dir=self.venv_dir)
+
     def uninstall(self, package_name: str) -> Tuple[bool, str]:
         """Uninstall a package."""
-        return uninstall_package_uv(self.venv_path, package_name)
+        return uninstall_package_uv(self.venv_path, package_name, _venv_dir=self.venv_dir)
     
     def update(self, package_name: str) -> Tuple[bool, str]:
         """Update a package."""
-        return update_package_uv(self.venv_path, package_name)
+        return update_package_uv(self.venv_path, package_name, _venv_dir=self.venv_dir)
     
     def import_requirements(self, requirements_file: str) -> Tuple[bool, str]:
         """Import from requirements file."""
-        return import_requirements_uv(self.venv_path, requirements_file)
+        return import_requirements_uv(self.venv_path, requirements_file, _venv_dir=self.venv_dir)
     
     def export_requirements(self, output_file: str) -> Tuple[bool, str]:
         """Export to requirements file."""
-        return export_requirements_uv(self.venv_path, output_file)
+        return export_requirements_uv(self.venv_path, output_file, _venv_dir=self.venv_dir)
     
     def check_outdated(self) -> Tuple[bool, List[dict]]:
         """Check for outdated packages."""
-        return check_outdated_packages_uv(self.venv_path)
+        return check_outdated_packages_uv(self.venv_path, _venv_dir=self.venv_dir)
     
     def get_package_info(self, package_name: str) -> Optional[dict]:
         """Get package information."""
-        return get_package_info_uv(self.venv_path, package_name)
+        return get_package_info_uv(self.venv_path, package_name, _venv_dir=self.venv_dir)
+
+    def get_package_info_many(self, package_names: List[str]) -> dict:
+        """Get package information for several packages concurrently."""
+        return get_package_info_many_uv(self.venv_path, package_names, _venv_dir=self.venv_dir)
@@ -3,28 +3,39 @@ import tkinter,json
 from tkinter import messagebox, filedialog
 import ctypes
 import customtkinter as ctk
+import collections
+import functools
 import os
-from PIL import Image, ImageTk
+import re
 import importlib.resources as pkg_resources
 from datetime import datetime as DT
-import webbrowser
 import logging
-from configparser import ConfigParser
 import threading
 import queue
-import datetime
+import sys
+import time
 import tkinter.ttk as ttk
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import orjson  # optional: much faster JSON decode for pip's output
+except ImportError:
+    orjson = None
 
 # project modules --------------------------------
 from py_env_studio.core.env_manager import (
-    create_env, rename_env, delete_env, activate_env, search_envs,
+    create_env, rename_env, delete_env, activate_env,
     get_env_data, set_env_data, is_valid_env_selected,
     list_pythons, is_valid_python_version_detected,
-    get_available_tools, add_tool
+    get_available_tools, add_tool, set_tools, list_envs, VENV_DIR,
+    get_package_manager_display, get_preferred_package_manager,
+    set_preferred_package_manager
 )
 from py_env_studio.core.package_manager import (
     list_packages, install_package, uninstall_package, update_package,
-    export_requirements, import_requirements, check_outdated_packages)
+    export_requirements, import_requirements, check_outdated_packages,
+    get_env_package_manager)
+from py_env_studio.core.pip_tools import _get_site_packages
 from py_env_studio.core.py_tonic import (
     PY_TONIC_LEARNING_MODES,
     PY_TONIC_NOTIFICATION_MODES,
@@ -37,9 +48,6 @@ from py_env_studio.core.py_tonic import (
     save_py_tonic_profile,
     should_notify,
 )
-from py_env_studio.utils.vulneribility_scanner import DBHelper, SecurityMatrix
-from  py_env_studio.utils.vulneribility_insights  import VulnerabilityInsightsApp
-from py_env_studio.core.plugins import PluginManager
 # ===== THEME & CONSTANTS =====
 class Theme:
     PADDING = 10
@@ -64,7 +72,137 @@ class Theme:
     FONT_CONSOLE = ("Courier", 12)
 
 
+# Startup only needs the version key; a single regex pass skips
+# ConfigParser's section/interpolation machinery on the paint-blocking path
+_VERSION_RE = re.compile(rb'^\s*version\s*=\s*(.+?)\s*$', re.M)
+
+# Widget classes resolved once; the factories below are called dozens of
+# times during UI construction
+_CTKBUTTON = ctk.CTkButton
+_CTKENTRY = ctk.CTkEntry
+_CTKLABEL = ctk.CTkLabel
+_CTKFRAME = ctk.CTkFrame
+_CTKOPTIONMENU = ctk.CTkOptionMenu
+_CTKCHECKBOX = ctk.CTkCheckBox
+
+_CHALLENGE_TITLE_FONT = ("Segoe UI", 16, "bold")
+
+# Plugin dialog fonts built once; fresh tuples per item make Tk re-parse
+# the font spec for every widget
+_PLUGIN_TITLE_FONT = ("Segoe UI", 12, "bold")
+_PLUGIN_SMALL_FONT = ("Segoe UI", 10)
+
+# Concurrent package updates per batch; tunable without touching UI code
+_BATCH_UPDATE_WORKERS = 8
+
+# Advisor option lists built once rather than per dialog open
+_PY_TONIC_NOTIFICATION_MODES_LIST = list(PY_TONIC_NOTIFICATION_MODES)
+_PY_TONIC_LEARNING_MODES_LIST = list(PY_TONIC_LEARNING_MODES)
+_PY_TONIC_ACTION_OPTIONS = [
+    "general", "create_env", "rename_env", "delete_env", "activate_env",
+    "install_package", "uninstall_package", "update_package",
+    "import_requirements", "export_requirements",
+]
+
+
+@functools.lru_cache(maxsize=32)
+def _advice_text(action):
+    """Formatted advisor text for an action; the advice is static, so each
+    action's string only ever gets built once."""
+    advice = get_py_tonic_advice(action)
+    parts = [
+        "Notification:\n- ", advice['notification'],
+        "\n\nBad example:\n- ", advice['bad_example'],
+        "\n\nRecommended:\n- ", advice['recommended'],
+        "\n\nMost used:\n",
+    ]
+    parts.extend(f"- {item}\n" for item in advice["most_used"])
+    return "".join(parts)
+
+# Per-env vulnerability scan cache: skip a full OSV/deps.dev scan when the
+# installed (package, version) set hasn't changed since the last good scan
+_VULN_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".py_env_studio", "vuln_cache")
+# New advisories get published for unchanged pins, so even an exact key
+# match expires after a day
+_VULN_CACHE_TTL_S = 24 * 3600
+
+
+def _vuln_cache_key(env_name, packages):
+    import hashlib
+    payload = [sorted([str(p), str(v)] for p, v in packages)]
+    # Fold in the dist-info mtimes so a reinstall at the same version
+    # (e.g. a local/editable rebuild) still misses the cache
+    site_packages = _get_site_packages(env_name)
+    if site_packages:
+        try:
+            payload.append(sorted(
+                [entry.name, entry.stat().st_mtime_ns]
+                for entry in os.scandir(site_packages)
+                if entry.name.endswith(".dist-info")
+            ))
+        except OSError:
+            pass
+    return hashlib.blake2b(json.dumps(payload).encode("utf-8")).hexdigest()
+
+
+def _vuln_cache_hit(env_name, cache_key):
+    try:
+        with open(os.path.join(_VULN_CACHE_DIR, f"{env_name}.json"), encoding="utf-8") as f:
+            entry = json.load(f)
+        if entry.get("key") != cache_key:
+            return False
+        scanned_at = DT.fromisoformat(entry["scanned_at"])
+        return (DT.now() - scanned_at).total_seconds() < _VULN_CACHE_TTL_S
+    except Exception:
+        return False
+
+
+def _vuln_cache_store(env_name, cache_key):
+    # Only successful scans are cached, so a failed run is always retried
+    try:
+        os.makedirs(_VULN_CACHE_DIR, exist_ok=True)
+        with open(os.path.join(_VULN_CACHE_DIR, f"{env_name}.json"), "w", encoding="utf-8") as f:
+            json.dump({"key": cache_key, "scanned_at": DT.now().isoformat()}, f)
+    except Exception as e:
+        logging.warning(f"Could not write vulnerability scan cache: {e}")
+
+
+class BufferedLogSink:
+    """Coalesces worker-thread log lines into single queue puts.
+
+    Every put wakes the Tk poller; chatty operations like long installs
+    emit hundreds of lines, so batching them keeps the event loop quiet."""
+
+    _FLUSH_INTERVAL = 0.1
+
+    def __init__(self, sink_queue):
+        self._queue = sink_queue
+        self._lock = threading.Lock()
+        self._buffer = []
+        self._timer = None
+
+    def write(self, msg):
+        with self._lock:
+            self._buffer.append(str(msg))
+            if self._timer is None:
+                self._timer = threading.Timer(self._FLUSH_INTERVAL, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        with self._lock:
+            self._timer = None
+            if not self._buffer:
+                return
+            batch = "\n".join(self._buffer)
+            self._buffer = []
+        self._queue.put(batch)
+
+
+@functools.lru_cache(maxsize=1)
 def get_config_path():
+    # The package location is fixed for the process lifetime; cache the
+    # importlib.resources traversal instead of repeating it per caller
     try:
         with pkg_resources.path('py_env_studio', 'config.ini') as config_path:
             return str(config_path)
@@ -80,6 +218,7 @@ def show_info(msg):
     messagebox.showinfo("Info", msg)
 
 def open_link(link):
+        import webbrowser
         webbrowser.open(link)
 
 class MoreActionsDialog(ctk.CTkToplevel):
@@ -147,59 +286,204 @@ class MoreActionsDialog(ctk.CTkToplevel):
             self.callback_scan(self.env_name)
 
 
+class _LazyIcons(dict):
+    """Icon registry that decodes each PNG lazily on first access.
+
+    Decoded RGBA pixels are cached on disk keyed by file mtime, so later
+    launches rebuild images with Image.frombytes and skip the PNG decode.
+    """
+
+    _MISSING = object()
+    _disk_cache = None
+    _CACHE_FILE = os.path.join(os.path.expanduser("~"), ".py_env_studio", "icon_cache.pkl")
+
+    def get(self, name, default=None):
+        value = super().get(name, self._MISSING)
+        if value is self._MISSING:
+            value = self._load(name)
+            self[name] = value
+        return value if value is not None else default
+
+    @classmethod
+    def _get_disk_cache(cls):
+        if cls._disk_cache is None:
+            import pickle
+            try:
+                with open(cls._CACHE_FILE, "rb") as f:
+                    cls._disk_cache = pickle.load(f)
+            except Exception:
+                cls._disk_cache = {}
+        return cls._disk_cache
+
+    @classmethod
+    def _flush_disk_cache(cls):
+        import pickle
+        try:
+            os.makedirs(os.path.dirname(cls._CACHE_FILE), exist_ok=True)
+            with open(cls._CACHE_FILE, "wb") as f:
+                pickle.dump(cls._disk_cache, f)
+        except Exception:
+            pass
+
+    @classmethod
+    def _load(cls, name):
+        from PIL import Image
+        try:
+            with pkg_resources.path('py_env_studio.ui.static.icons', f"{name}.png") as p:
+                path = str(p)
+                mtime = os.path.getmtime(path)
+                cache = cls._get_disk_cache()
+                entry = cache.get(path)
+                if entry is not None and entry[0] == mtime:
+                    img = Image.frombytes("RGBA", entry[1], entry[2])
+                else:
+                    img = Image.open(path).convert("RGBA")
+                    cache[path] = (mtime, img.size, img.tobytes())
+                    cls._flush_disk_cache()
+                return ctk.CTkImage(img)
+        except Exception:
+            return None
+
+
 class PyEnvStudio(ctk.CTk):
     def __init__(self):
         super().__init__()
         self.theme = Theme()
         self._setup_config()
+        # Interpreter/tool discovery scans PATH and the filesystem; overlap
+        # it with widget construction instead of blocking first paint
+        self._discovery_pool = ThreadPoolExecutor(max_workers=2)
+        # Two pools so quick metadata reads never queue behind a slow pip
+        # install: a narrow one for long subprocess work (install/export/
+        # activate/create/scan) and a wider one for local FS and pip-list
+        # style lookups
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='env-io')
+        self._meta_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='env-meta')
+        self._pythons_future = self._discovery_pool.submit(list_pythons)
+        self._tools_future = self._discovery_pool.submit(get_available_tools)
+        # Pre-import the vulnerability scanner stack (requests, cvss, DB
+        # layer) in the background so the first Scan Now click doesn't pay
+        # the import cost
+        self._meta_pool.submit(self._warm_up_scanner)
         self._setup_vars()
         self._setup_window()
         self.icons = self._load_icons()
-        self._setup_plugins()
         self._setup_ui()
         self._setup_logging()
+        # Plugin discovery walks the plugins dir and imports modules; run it
+        # on the idle queue so the window paints first and a broken plugin
+        # can't keep the UI from appearing
+        self.plugin_manager = None
+        self.after_idle(self._setup_plugins)
 
     def _setup_config(self):
-        self.app_config = ConfigParser()
-        self.app_config.read(get_config_path())
-        self.version = self.app_config.get('project', 'version', fallback='1.0.0')
+        self.config_path = get_config_path()
+        try:
+            with open(self.config_path, 'rb') as f:
+                raw = f.read()
+        except OSError:
+            raw = b""
+        match = _VERSION_RE.search(raw)
+        self.version = match.group(1).decode('utf-8') if match else '1.0.0'
+        # Full ConfigParser view built lazily (plugins receive it via context)
+        self._app_config = None
+        self._config_dict = None
+
+    @property
+    def app_config(self):
+        if self._app_config is None:
+            from configparser import ConfigParser
+            self._app_config = ConfigParser()
+            self._app_config.read(self.config_path)
+        return self._app_config
+
+    @property
+    def config_dict(self):
+        """Config as a read-only plain dict: downstream reads are O(1) hash
+        lookups instead of ConfigParser's per-call SectionProxy/interpolation."""
+        if self._config_dict is None:
+            import types
+            cfg = self.app_config
+            self._config_dict = types.MappingProxyType(
+                {section: dict(cfg.items(section)) for section in cfg.sections()}
+            )
+        return self._config_dict
 
     def _setup_vars(self):
+        self._search_after_id = None
+        self._select_after_id = None
+        self._env_cache = {"mtime": None, "list": []}
+        self._env_manager_cache = {}
+        self._manager_display_cache = {}
+        self._scan_init_lock = threading.Lock()
+        self._scanner = None
+        self._last_style_mode = None
+        self._last_tab_state = None
+        self._last_set_appearance = None
+        # Bounded console history: oldest lines fall off instead of the
+        # textbox growing without limit during long-running installs
+        self._log_ring = collections.deque(maxlen=2000)
+        self._log_idle_ticks = 0
         self.env_search_var = tkinter.StringVar()
         self.selected_env_var = tkinter.StringVar()
         self.dir_var = tkinter.StringVar()
-        # Load open_with tools from config or default
-        self.open_with_tools = self._load_open_with_tools()
+        # Load open_with tools from config or default; use a placeholder
+        # until the background discovery finishes
+        if self._tools_future.done():
+            self.open_with_tools = self._load_open_with_tools(self._tools_future.result())
+        else:
+            self.open_with_tools = ["CMD", "Add Tool..."]
+            self.after(200, self._apply_discovered_tools)
         self.open_with_var = tkinter.StringVar(value=self.open_with_tools[0] if self.open_with_tools else "CMD")
         self.choosen_python_var = tkinter.StringVar()
         self.env_log_queue = queue.Queue()
-        self.env_log_queue = queue.Queue()
+        self._log_sink = BufferedLogSink(self.env_log_queue)
+        # load_py_tonic_profile already sanitizes (and persists defaults on
+        # first run); re-saving here only repeated the same disk write
         self.py_tonic_profile = load_py_tonic_profile()
-        self.py_tonic_profile = save_py_tonic_profile(self.py_tonic_profile)
 
-    def _load_open_with_tools(self):
-        tools = get_available_tools()
+    def _load_open_with_tools(self, tools=None):
+        if tools is None:
+            tools = get_available_tools()
         names = [t["name"] for t in tools]
         if "Add Tool..." not in names:
             names.append("Add Tool...")
         return names
 
+    def _apply_discovered_tools(self):
+        if not self._tools_future.done():
+            self.after(200, self._apply_discovered_tools)
+            return
+        self.open_with_tools = self._load_open_with_tools(self._tools_future.result())
+        self.open_with_dropdown.configure(values=self.open_with_tools)
+        if self.open_with_var.get() not in self.open_with_tools:
+            self.open_with_var.set(self.open_with_tools[0])
+
+    def _apply_discovered_pythons(self):
+        if not self._pythons_future.done():
+            self.after(200, self._apply_discovered_pythons)
+            return
+        self.available_python.configure(values=self._pythons_future.result())
+
     def _save_open_with_tools(self):
-        # Save current open_with_tools to config via env_manager
-        # Only save user-added tools (skip 'Add Tool...')
-        for t in self.open_with_tools:
-            if t != "Add Tool...":
-                add_tool(t)
+        # Save current open_with_tools to config via env_manager in one
+        # write (skip 'Add Tool...')
+        set_tools([t for t in self.open_with_tools if t != "Add Tool..."])
+
+    # Process-wide: the AppUserModelID only needs to be set once, even if
+    # the window is created several times in one process
+    _appid_set = False
 
     def _setup_window(self):
         # Add Windows taskbar icon fix at the start
-        if os.name == 'nt':  # Windows only
+        if os.name == 'nt' and not PyEnvStudio._appid_set:  # Windows only
             try:
                 myappid = 'pyenvstudio.application.1.0'
                 ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(myappid)
+                PyEnvStudio._appid_set = True
             except Exception as e:
                 logging.warning(f"Could not set Windows AppUserModelID: {e}")
-        
+
         ctk.set_appearance_mode("System")
         ctk.set_default_color_theme("blue")
         self.title("PyEnvStudio")
@@ -209,53 +493,88 @@ class PyEnvStudio(ctk.CTk):
         self.grid_rowconfigure(0, weight=1)
 
         try:
+            from PIL import ImageTk
             with pkg_resources.path('py_env_studio.ui.static.icons', 'pes-transparrent-icon-default.ico') as p:
                 self.icon = ImageTk.PhotoImage(file=str(p))
 
-            # Clear default icon and set new one with delay for reliability on Windows
+            # Clear default icon and set new one with delay for reliability
+            # on Windows; one scheduled callback covers both icon calls
             self.wm_iconbitmap()
-            # Use iconbitmap for .ico files first, then iconphoto
-            self.after(300, lambda: self.iconbitmap(str(p)))
-            self.after(350, lambda: self.iconphoto(False, self.icon))
+            self._icon_path = str(p)
+            self.after(300, self._apply_icon)
         except Exception as e:
             logging.warning(f"Could not set icon: {e}")
 
+    def _apply_icon(self):
+        if not self.winfo_exists():
+            return
+        try:
+            # iconbitmap for the .ico first, then iconphoto
+            self.iconbitmap(self._icon_path)
+            self.iconphoto(False, self.icon)
+        except Exception as e:
+            logging.warning(f"Could not apply icon: {e}")
+
 
     def _setup_logging(self):
         # Initialize console logger with queue for UI display
-        self.env_search_var.trace_add('write', lambda *_: self.refresh_env_list())
+        self.env_search_var.trace_add('write', self._on_search_changed)
         self.after(100, self.process_log_queues)
 
+    def _on_search_changed(self, *_):
+        # Debounce: one env-list rebuild after the user pauses typing
+        # instead of one per keystroke
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(150, self._run_search_refresh)
+
+    def _run_search_refresh(self):
+        self._search_after_id = None
+        self.refresh_env_list()
+
+    def _cfg_grid(self, w, cols=(), rows=()):
+        # Batch grid weight setup: one helper call per container instead of
+        # scattered per-index grid_*configure dispatches
+        for c, wt in cols:
+            w.grid_columnconfigure(c, weight=wt)
+        for r, wt in rows:
+            w.grid_rowconfigure(r, weight=wt)
+
     # ===== Widget Factories =====
+    # The factories run ~30+ times during _setup_ui; caching the widget
+    # classes at module scope and the theme in a local trims the repeated
+    # attribute-chain lookups on the construction hot path
     def btn(self, parent, text, cmd, image=None, width=150, height=None, **kw):
-        return ctk.CTkButton(parent, text=text, command=cmd, image=image,
-                             width=width, height=height or self.theme.BUTTON_HEIGHT,
-                             fg_color=self.theme.PRIMARY_COLOR, hover_color="#104E8B", **kw)
+        t = self.theme
+        return _CTKBUTTON(parent, text=text, command=cmd, image=image,
+                          width=width, height=height or t.BUTTON_HEIGHT,
+                          fg_color=t.PRIMARY_COLOR, hover_color="#104E8B", **kw)
 
     def entry(self, parent, ph="", var=None, width=None, **kw):
-        return ctk.CTkEntry(parent, placeholder_text=ph, textvariable=var,
-                            width=width or self.theme.ENTRY_WIDTH, **kw)
+        return _CTKENTRY(parent, placeholder_text=ph, textvariable=var,
+                         width=width or self.theme.ENTRY_WIDTH, **kw)
 
     def lbl(self, parent, text, **kw):
-        return ctk.CTkLabel(parent, text=text, **kw)
+        return _CTKLABEL(parent, text=text, **kw)
 
     def frame(self, parent, **kw):
-        return ctk.CTkFrame(parent, **kw)
+        return _CTKFRAME(parent, **kw)
 
     def optmenu(self, parent, vals, cmd=None, var=None, **kw):
-        return ctk.CTkOptionMenu(parent, values=vals, command=cmd, variable=var,
-                                 height=self.theme.BUTTON_HEIGHT, **kw)
+        return _CTKOPTIONMENU(parent, values=vals, command=cmd, variable=var,
+                              height=self.theme.BUTTON_HEIGHT, **kw)
 
     def chk(self, parent, text, **kw):
-        return ctk.CTkCheckBox(parent, text=text, **kw)
+        return _CTKCHECKBOX(parent, text=text, **kw)
 
     # ===== PLUGINS =====
     def _setup_plugins(self):
         """Initialize plugin manager and auto-load enabled plugins on startup."""
+        from py_env_studio.core.plugins import PluginManager
         self.plugin_manager = PluginManager()
         self.plugin_manager.set_app_context({
             "app": self,
-            "config": self.app_config,
+            "config": self.config_dict,
             "logger": logging.getLogger(__name__)
         })
         
@@ -287,16 +606,9 @@ class PyEnvStudio(ctk.CTk):
 
     # ===== ICONS =====
     def _load_icons(self):
-        names = ["logo", "create-env", "delete-env", "selected-env", "activate-env",
-                 "install", "uninstall", "requirements", "export", "packages", "update", "about"]
-        out = {}
-        for n in names:
-            try:
-                with pkg_resources.path('py_env_studio.ui.static.icons', f"{n}.png") as p:
-                    out[n] = ctk.CTkImage(Image.open(str(p)))
-            except Exception:
-                out[n] = None
-        return out
+        # Icons decode on first .get() instead of all 12 PNGs up front;
+        # ones never shown (e.g. a tab the user never opens) never decode
+        return _LazyIcons()
 
     # ===== UI SETUP =====
     def _setup_ui(self):
@@ -311,48 +623,42 @@ class PyEnvStudio(ctk.CTk):
     def _setup_menubar(self):
         menubar = tkinter.Menu(self)
 
-        # === File Menu ===
-        file_menu = tkinter.Menu(menubar, tearoff=0)
-        # Use the _pkg_install_section for install package dialog
-        file_menu.add_command(label="Install Package", command=self.show_install_package_dialog)
-
-        file_menu.add_command(label="Install Requirements", command=self.install_requirements)
-        file_menu.add_command(label="Export Packages", command=self.export_packages)
-        # file_menu.add_command(label="Preferences", command=self.show_preferences_dialog)
-        file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.quit)
-
-        # === Edit Menu ===
-        edit_menu = tkinter.Menu(menubar, tearoff=0)
-        # edit_menu.add_command(label="Rename Env", command=lambda: self.rename_selected_env())
-        # edit_menu.add_command(label="Delete Env", command=lambda: self.delete_selected_env())
-
-        # === View Menu ===
-        view_menu = tkinter.Menu(menubar, tearoff=0)
-        view_menu.add_command(label="Refresh Environments", command=self.refresh_env_list)
-
-        # === Tools Menu ===
-        tools_menu = tkinter.Menu(menubar, tearoff=0)
-        tools_menu.add_command(label="Scan Now", command=lambda: self.scan_environment_now(self.selected_env_var.get()))
-        tools_menu.add_command(label="Vulnerability Report", command=lambda: self.show_vulnerability_report(self.selected_env_var.get()))
-        tools_menu.add_command(label="Check for Package Updates", command=lambda: self.check_for_package_updates(self.selected_env_var.get()))
-        # tools_menu.add_command(label="Py-Tonic Advisor", command=self.show_py_tonic_advisor)
-        tools_menu.add_separator()
-        tools_menu.add_command(label="Plugins", command=self.show_plugins_dialog)
-
-        # === Help Menu ===
-        help_menu = tkinter.Menu(menubar, tearoff=0)
-        # read the docs link
-        help_menu.add_command(label="Documentation", command=lambda: open_link("https://py-env-studio.readthedocs.io/en/latest/"))
-        help_menu.add_command(label="About", command=self.show_about_dialog)
-        # help_menu.add_command(label="Check for Updates", command=self.check_outdated_packages)
-
-        # === set menubar ===
-        menubar.add_cascade(label="File", menu=file_menu)
-        # menubar.add_cascade(label="Edit", menu=edit_menu)
-        menubar.add_cascade(label="View", menu=view_menu)
-        menubar.add_cascade(label="Tools", menu=tools_menu)
-        menubar.add_cascade(label="Help", menu=help_menu)
+        # Data-driven build: one table of (menu, items), one loop of Tk
+        # calls; None entries become separators
+        menus = [
+            ("File", [
+                ("Install Package", self.show_install_package_dialog),
+                ("Install Requirements", self.install_requirements),
+                ("Export Packages", self.export_packages),
+                None,
+                ("Exit", self.quit),
+            ]),
+            ("View", [
+                ("Refresh Environments", self.refresh_env_list),
+            ]),
+            ("Tools", [
+                ("Scan Now", lambda: self.scan_environment_now(self.selected_env_var.get())),
+                ("Vulnerability Report", lambda: self.show_vulnerability_report(self.selected_env_var.get())),
+                ("Check for Package Updates", lambda: self.check_for_package_updates(self.selected_env_var.get())),
+                None,
+                ("Plugins", self.show_plugins_dialog),
+            ]),
+            ("Help", [
+                ("Documentation", lambda: open_link("https://py-env-studio.readthedocs.io/en/latest/")),
+                ("About", self.show_about_dialog),
+            ]),
+        ]
+
+        for menu_label, items in menus:
+            menu = tkinter.Menu(menubar, tearoff=0)
+            for item in items:
+                if item is None:
+                    menu.add_separator()
+                else:
+                    label, command = item
+                    menu.add_command(label=label, command=command)
+            menubar.add_cascade(label=menu_label, menu=menu)
+
         self.config(menu=menubar)
 
     def _setup_sidebar(self):
@@ -360,6 +666,7 @@ class PyEnvStudio(ctk.CTk):
         sb.grid(row=0, column=0, sticky="nsew")
         sb.grid_rowconfigure(4, weight=1)
         try:
+            from PIL import Image
             with pkg_resources.path('py_env_studio.ui.static.icons', 'pes-default-transparrent.png') as p:
                 img = ctk.CTkImage(Image.open(str(p)), size=self.theme.LOGO_SIZE)
         except:
@@ -386,8 +693,7 @@ class PyEnvStudio(ctk.CTk):
     # === ENV TAB CARD LAYOUT ===
     def _setup_env_tab(self):
         env_tab = self.tabview.tab("Environments")
-        env_tab.grid_rowconfigure(5, weight=1)
-        env_tab.grid_rowconfigure(6, weight=0)
+        self._cfg_grid(env_tab, rows=[(5, 1), (6, 0)])
         self._env_create_section(env_tab)
         self._env_activate_section(env_tab)
         self._env_search_section(env_tab)
@@ -418,9 +724,14 @@ class PyEnvStudio(ctk.CTk):
         self.lbl(f, "or select:").grid(row=1, column=3, padx=(5, 5), pady=5, sticky="w")
 
         # OptionMenu for python interpreters on same row, next column
+        if self._pythons_future.done():
+            pythons = self._pythons_future.result()
+        else:
+            pythons = []
+            self.after(200, self._apply_discovered_pythons)
         self.available_python = self.optmenu(
             f,
-            list_pythons(),
+            pythons,
             var=self.choosen_python_var,
             cmd=self.browse_python_path,
             width=150
@@ -441,7 +752,6 @@ class PyEnvStudio(ctk.CTk):
             width=150
         )
         self.create_env_pkg_mgr.grid(row=3, column=1, padx=(0, 5), pady=5, sticky="w")
-        from py_env_studio.core.env_manager import get_preferred_package_manager
         self.create_env_pkg_mgr.set(get_preferred_package_manager())
 
         # show python version information label below checkbox
@@ -515,8 +825,7 @@ class PyEnvStudio(ctk.CTk):
     # === PKG TAB ===
     def _setup_pkg_tab(self):
         pkg_tab = self.tabview.tab("Packages")
-        pkg_tab.grid_rowconfigure(4, weight=1)
-        pkg_tab.grid_rowconfigure(5, weight=0)
+        self._cfg_grid(pkg_tab, rows=[(4, 1), (5, 0)])
         self._pkg_header(pkg_tab)
         self._pkg_install_section(pkg_tab)
         self._pkg_bulk_section(pkg_tab)
@@ -586,15 +895,13 @@ class PyEnvStudio(ctk.CTk):
         top.geometry("760x520")
         top.transient(self)
         top.grab_set()
-        top.grid_columnconfigure(0, weight=1)
-        top.grid_rowconfigure(2, weight=1)
-        top.grid_rowconfigure(4, weight=1)
+        self._cfg_grid(top, cols=[(0, 1)], rows=[(2, 1), (4, 1)])
         top.geometry(f"+{self.winfo_rootx() + 300}+{self.winfo_rooty() + 170}")
 
         ctk.CTkLabel(
             top,
             text=f"{challenge['title']} ({challenge['topic']})",
-            font=("Segoe UI", 16, "bold"),
+            font=_CHALLENGE_TITLE_FONT,
         ).grid(row=0, column=0, padx=16, pady=(14, 6), sticky="w")
         ctk.CTkLabel(top, text=challenge["prompt"], anchor="w").grid(row=1, column=0, padx=16, pady=(0, 6), sticky="ew")
 
@@ -611,13 +918,16 @@ class PyEnvStudio(ctk.CTk):
 
         hint_index = {"value": 0}
         learning_mode = self.py_tonic_profile.get("mode", "learning") == "learning"
+        # Normalize the expected answer once per dialog; check_answer then
+        # only has to normalize the user's input on each attempt
+        expected_answer = str(challenge.get("expected_answer", "")).strip().lower()
 
         def check_answer():
             answer = answer_box.get("1.0", "end").strip()
             if not answer:
                 status.configure(text="Please enter an answer.", text_color=self.theme.ERROR_COLOR)
                 return
-            if evaluate_challenge_answer(challenge, answer):
+            if answer.lower() == expected_answer:
                 result["passed"] = True
                 status.configure(text="Correct. Challenge passed.", text_color=self.theme.SUCCESS_COLOR)
                 self.env_log_queue.put(f"[Py-Tonic] Challenge solved: {challenge['id']}")
@@ -673,10 +983,7 @@ class PyEnvStudio(ctk.CTk):
         top.geometry("950x620")
         top.transient(self)
         top.grab_set()
-        top.grid_columnconfigure(0, weight=1)
-        top.grid_columnconfigure(1, weight=1)
-        top.grid_rowconfigure(2, weight=1)
-        top.grid_rowconfigure(3, weight=1)
+        self._cfg_grid(top, cols=[(0, 1), (1, 1)], rows=[(2, 1), (3, 1)])
         top.geometry(f"+{self.winfo_rootx() + 300}+{self.winfo_rooty() + 180}")
 
         ctk.CTkLabel(top, text="Py-Tonic: Python Best Practices", font=("Segoe UI", 18, "bold")).grid(
@@ -686,52 +993,47 @@ class PyEnvStudio(ctk.CTk):
         profile = self.py_tonic_profile
         frequency_var = tkinter.StringVar(value=profile.get("notification_frequency", "daily"))
         mode_var = tkinter.StringVar(value=profile.get("mode", "learning"))
-        action_options = [
-            "general", "create_env", "rename_env", "delete_env", "activate_env",
-            "install_package", "uninstall_package", "update_package",
-            "import_requirements", "export_requirements",
-        ]
         action_var = tkinter.StringVar(value="general")
-        topic_vars = {
-            topic: tkinter.BooleanVar(value=topic in profile.get("topics", []))
+        # BooleanVars kept in a list aligned with the PY_TONIC_TOPICS tuple;
+        # membership checked against a set built once
+        topics_set = set(profile.get("topics", ()))
+        topic_vars = [
+            tkinter.BooleanVar(value=topic in topics_set)
             for topic in PY_TONIC_TOPICS
-        }
+        ]
 
         settings = self.frame(top, corner_radius=12, border_width=1, border_color=self.theme.BORDER_COLOR)
         settings.grid(row=1, column=0, columnspan=2, padx=16, pady=8, sticky="ew")
         settings.grid_columnconfigure(5, weight=1)
         self.lbl(settings, "Notify:", font=self.theme.FONT_BOLD).grid(row=0, column=0, padx=(10, 4), pady=10, sticky="w")
-        self.optmenu(settings, list(PY_TONIC_NOTIFICATION_MODES), var=frequency_var, width=120).grid(row=0, column=1, padx=4, pady=10)
+        self.optmenu(settings, _PY_TONIC_NOTIFICATION_MODES_LIST, var=frequency_var, width=120).grid(row=0, column=1, padx=4, pady=10)
         self.lbl(settings, "Mode:", font=self.theme.FONT_BOLD).grid(row=0, column=2, padx=(12, 4), pady=10, sticky="w")
-        self.optmenu(settings, list(PY_TONIC_LEARNING_MODES), var=mode_var, width=120).grid(row=0, column=3, padx=4, pady=10)
+        self.optmenu(settings, _PY_TONIC_LEARNING_MODES_LIST, var=mode_var, width=120).grid(row=0, column=3, padx=4, pady=10)
         self.lbl(settings, "Topics:", font=self.theme.FONT_BOLD).grid(row=0, column=4, padx=(12, 4), pady=10, sticky="w")
-        self.chk(settings, "Core Python", variable=topic_vars["core_python"]).grid(row=0, column=5, padx=4, pady=10, sticky="w")
-        self.chk(settings, "Python Django", variable=topic_vars["python_django"]).grid(row=0, column=6, padx=4, pady=10, sticky="w")
+        self.chk(settings, "Core Python", variable=topic_vars[PY_TONIC_TOPICS.index("core_python")]).grid(row=0, column=5, padx=4, pady=10, sticky="w")
+        self.chk(settings, "Python Django", variable=topic_vars[PY_TONIC_TOPICS.index("python_django")]).grid(row=0, column=6, padx=4, pady=10, sticky="w")
         self.btn(
             settings,
             "Save Settings",
             lambda: self._save_py_tonic_settings(
                 frequency_var.get(),
                 mode_var.get(),
-                {topic: var.get() for topic, var in topic_vars.items()},
+                dict(zip(PY_TONIC_TOPICS, (var.get() for var in topic_vars))),
             ),
             width=130,
         ).grid(row=0, column=7, padx=(8, 10), pady=10)
 
         left = self.frame(top, corner_radius=12, border_width=1, border_color=self.theme.BORDER_COLOR)
         left.grid(row=2, column=0, rowspan=2, padx=(16, 8), pady=8, sticky="nsew")
-        left.grid_columnconfigure(0, weight=1)
-        left.grid_rowconfigure(2, weight=1)
+        self._cfg_grid(left, cols=[(0, 1)], rows=[(2, 1)])
         self.lbl(left, "Action Advice", font=self.theme.FONT_BOLD).grid(row=0, column=0, padx=12, pady=(10, 6), sticky="w")
-        self.optmenu(left, action_options, var=action_var, width=190).grid(row=1, column=0, padx=12, pady=(0, 6), sticky="w")
+        self.optmenu(left, _PY_TONIC_ACTION_OPTIONS, var=action_var, width=190).grid(row=1, column=0, padx=12, pady=(0, 6), sticky="w")
         advice_box = ctk.CTkTextbox(left, wrap="word")
         advice_box.grid(row=2, column=0, padx=12, pady=(0, 12), sticky="nsew")
 
         right = self.frame(top, corner_radius=12, border_width=1, border_color=self.theme.BORDER_COLOR)
         right.grid(row=2, column=1, rowspan=2, padx=(8, 16), pady=8, sticky="nsew")
-        right.grid_columnconfigure(0, weight=1)
-        right.grid_rowconfigure(2, weight=1)
-        right.grid_rowconfigure(4, weight=1)
+        self._cfg_grid(right, cols=[(0, 1)], rows=[(2, 1), (4, 1)])
         self.lbl(right, "Interactive Coding Window", font=self.theme.FONT_BOLD).grid(row=0, column=0, padx=12, pady=(10, 6), sticky="w")
         challenge_code = ctk.CTkTextbox(right, wrap="none", height=130)
         challenge_code.grid(row=2, column=0, padx=12, pady=(0, 6), sticky="nsew")
@@ -743,25 +1045,22 @@ class PyEnvStudio(ctk.CTk):
 
         challenge_state = {"challenge": None, "hint_idx": 0}
 
+        advice_state = {"last_action": None}
+
         def render_advice():
-            advice = get_py_tonic_advice(action_var.get())
+            # The trace fires on every write, including same-value sets;
+            # skip the delete+insert cycle when nothing changed
+            action = action_var.get()
+            if action == advice_state["last_action"]:
+                return
+            advice_state["last_action"] = action
             advice_box.configure(state="normal")
             advice_box.delete("1.0", "end")
-            advice_box.insert(
-                "end",
-                "Notification:\n"
-                f"- {advice['notification']}\n\n"
-                "Bad example:\n"
-                f"- {advice['bad_example']}\n\n"
-                "Recommended:\n"
-                f"- {advice['recommended']}\n\n"
-                "Most used:\n"
-                + "\n".join([f"- {item}" for item in advice["most_used"]])
-            )
+            advice_box.insert("end", _advice_text(action))
             advice_box.configure(state="disabled")
 
         def load_challenge():
-            temp_topics = [topic for topic, var in topic_vars.items() if var.get()] or ["core_python"]
+            temp_topics = [topic for topic, var in zip(PY_TONIC_TOPICS, topic_vars) if var.get()] or ["core_python"]
             temp_profile = self.py_tonic_profile.copy()
             temp_profile["topics"] = temp_topics
             temp_profile["mode"] = mode_var.get()
@@ -832,7 +1131,7 @@ class PyEnvStudio(ctk.CTk):
 
     # === Environment & Package Logic follows (using Treeview for Packages) ===
     # ===== LOGIC: Async, logging, events, environment ops, package ops =====
-    def run_async(self, func, success_msg=None, error_msg=None, callback=None, py_tonic_action=None):
+    def run_async(self, func, success_msg=None, error_msg=None, callback=None, py_tonic_action=None, pool="io"):
         if py_tonic_action and not self._enforce_strict_py_tonic(py_tonic_action):
             return
 
@@ -848,25 +1147,59 @@ class PyEnvStudio(ctk.CTk):
                     self.after(0, lambda e=e: show_error(f"{error_msg}: {str(e)}"))
             if callback:
                 self.after(0, callback)
-        threading.Thread(target=target, daemon=True).start()
+        executor = self._meta_pool if pool == "meta" else self._io_pool
+        executor.submit(target)
 
     def process_log_queues(self):
-        self._process_log_queue(self.env_log_queue, self.console_frame)
-        self.after(100, self.process_log_queues)
+        drained = self._process_log_queue(self.env_log_queue, self.console_frame)
+        # Adaptive poll: ~30Hz while messages are flowing (one insert and
+        # one repaint per tick no matter the log volume), backing off
+        # toward 500ms after idle ticks so an idle app wakes Tk less
+        if drained:
+            self._log_idle_ticks = 0
+            delay = 33
+        else:
+            self._log_idle_ticks += 1
+            delay = min(500, 100 * (1 << min(self._log_idle_ticks, 3)))
+        self.after(delay, self.process_log_queues)
 
     def _process_log_queue(self, q, console):
+        # Drain in one batch (capped so a flood can't stall the event loop)
+        # and render the bounded ring in one shot: exactly one configure
+        # toggle, one insert and one see("end") per tick, and no Tk calls
+        # at all when the queue was empty
+        # One timestamp per drain (a C-level strftime, no datetime object
+        # per message); the batch spans well under a second anyway
+        lines = []
         try:
-            while True:
+            ts = time.strftime('%H:%M:%S')
+            while len(lines) < 200:
                 msg = q.get_nowait()
-                console.configure(state="normal")
-                console.insert("end", f"[{datetime.datetime.now().strftime('%H:%M:%S')}] {msg}\n")
-                console.configure(state="disabled")
-                console.see("end")
+                lines.append(f"[{ts}] {msg}")
         except queue.Empty:
             pass
+        if lines:
+            self._log_ring.extend(lines)
+            console.configure(state="normal")
+            # Append only the new lines, then trim the oldest in a single
+            # delete: amortized O(new lines) per drain instead of repainting
+            # the whole history, with the textbox still capped at ring size
+            console.insert("end", "\n".join(lines) + "\n")
+            line_count = int(console.index('end-1c').split('.')[0])
+            if line_count > self._log_ring.maxlen:
+                console.delete('1.0', f'{line_count - self._log_ring.maxlen}.0')
+            console.configure(state="disabled")
+            console.see("end")
+        return len(lines)
 
     def update_treeview_style(self):
+        # ttk styles are process-wide; reconfiguring them on every refresh
+        # invalidates cached widget geometry, so only redo it when the
+        # appearance mode actually flipped
         mode = ctk.get_appearance_mode()
+        if mode == self._last_style_mode:
+            return
+        self._last_style_mode = mode
         bg_color = self.theme.TEXT_COLOR_DARK if mode == "Light" else self.theme.TEXT_COLOR_LIGHT
         fg_color = self.theme.TEXT_COLOR_LIGHT if mode == "Light" else self.theme.TEXT_COLOR_DARK
         style = ttk.Style()
@@ -878,11 +1211,35 @@ class PyEnvStudio(ctk.CTk):
         style.configure("Treeview.Heading", font=self.theme.FONT_BOLD)
 
     # ===== ENVIRONMENTS TABLE =====
-    
-    def refresh_env_list(self):
-        for widget in self.env_scrollable_frame.winfo_children():
-            widget.destroy()
-        envs = search_envs(self.env_search_var.get())
+
+    def _get_envs_filtered(self, query):
+        """Return envs matching the query, re-listing the venv dir only
+        when its mtime changed since the last refresh."""
+        try:
+            mtime = os.stat(VENV_DIR).st_mtime_ns
+        except OSError:
+            mtime = None
+        if mtime is not None and mtime == self._env_cache["mtime"]:
+            all_envs = self._env_cache["list"]
+        else:
+            all_envs = list_envs()
+            self._env_cache = {"mtime": mtime, "list": all_envs}
+            # Creates/renames/deletes land here; per-env manager detection
+            # must be redone for the new set
+            self._env_manager_cache.clear()
+        if not query:
+            return all_envs
+        query = query.lower()
+        return [env for env in all_envs if query in env.lower()]
+
+    def _ensure_env_tree(self):
+        """Create the environments Treeview once; refreshes reuse it.
+
+        Destroying and rebuilding the widget (plus its bindings) on every
+        refresh is far more expensive than clearing its rows.
+        """
+        if getattr(self, "env_tree", None) is not None and self.env_tree.winfo_exists():
+            return
         # Updated columns - added VM_TOOL after PYTHON_VERSION
         columns = ("ENVIRONMENT", "PYTHON_VERSION", "VM_TOOL", "LAST_LOCATION", "SIZE", "RENAME", "DELETE", "LAST_SCANNED", "MORE")
         self.env_tree = ttk.Treeview(
@@ -902,95 +1259,94 @@ class PyEnvStudio(ctk.CTk):
             self.env_tree.heading(col, text=text)
             self.env_tree.column(col, width=width, anchor=anchor)
         self.env_tree.grid(row=0, column=0, columnspan=2, padx=10, pady=(0, 10), sticky="nsew")
-        self.update_treeview_style()
+        self._bind_env_tree_events()
 
-        for env in envs:
-            data = get_env_data(env)
-            # Get the VM tool display - use get_env_package_manager to get the correct manager
-            from py_env_studio.core.env_manager import get_package_manager_display
-            from py_env_studio.core.package_manager import get_env_package_manager
+    def refresh_env_list(self):
+        self._ensure_env_tree()
+        self.update_treeview_style()
+        # Row data comes from the filesystem (pyvenv.cfg, env data JSON,
+        # manager detection); gather it on the worker pool and marshal only
+        # the finished display tuples back to the Tk thread
+        query = self.env_search_var.get()
+        future = self._meta_pool.submit(self._gather_env_rows, query)
+        future.add_done_callback(self._on_env_rows_ready)
+
+    def _gather_env_rows(self, query):
+        envs = self._get_envs_filtered(query)
+        return [self._env_row_values(env) for env in envs]
+
+    def _on_env_rows_ready(self, future):
+        try:
+            rows = future.result()
+        except Exception as e:
+            logging.error(f"Failed to gather environment rows: {e}")
+            return
+        self.after(0, self._apply_env_rows, rows)
+
+    def _apply_env_rows(self, rows):
+        # Reuse existing rows in place when the count matches (the common
+        # periodic-refresh case), otherwise detach the tree while
+        # bulk-inserting so Tk doesn't re-layout after every row
+        children = self.env_tree.get_children()
+        if len(children) == len(rows):
+            for iid, values in zip(children, rows):
+                self.env_tree.item(iid, values=values)
+        else:
+            self.env_tree.grid_remove()
+            if children:
+                self.env_tree.delete(*children)
+            for values in rows:
+                self.env_tree.insert("", "end", values=values)
+            self.env_tree.grid()
+
+    def _env_row_values(self, env):
+        data = get_env_data(env)
+        # Manager detection re-reads env data and the display string
+        # shells out for a version; both are cached across rows and
+        # refreshes, dropped whenever the env list itself changes
+        manager = self._env_manager_cache.get(env)
+        if manager is None:
             manager = get_env_package_manager(env)
+            self._env_manager_cache[env] = manager
+        vm_tool = self._manager_display_cache.get(manager)
+        if vm_tool is None:
             vm_tool = get_package_manager_display(manager)
-            
-            self.env_tree.insert("", "end", values=(
-                env,
-                data.get("python_version", "-"),
-                vm_tool,
-                data.get("recent_location", "heh"),
-                data.get("size", "-"),
-                "🖊",
-                "🗑️",
-                data.get("last_scanned", "-"),
-                "⋮"  # more
-            ))
+            self._manager_display_cache[manager] = vm_tool
+
+        return (
+            env,
+            data.get("python_version", "-"),
+            vm_tool,
+            data.get("recent_location", "heh"),
+            data.get("size", "-"),
+            "🖊",
+            "🗑️",
+            data.get("last_scanned", "-"),
+            "⋮"  # more
+        )
+
+    def _bind_env_tree_events(self):
+        # Column -> handler dispatch bound once; no closures are recreated
+        # on refresh and the click path is a single dict lookup
+        self._col_handlers = {
+            "#1": self._select_env_row, "#2": self._select_env_row,
+            "#3": self._select_env_row, "#5": self._select_env_row,
+            "#8": self._select_env_row,
+            "#4": self._copy_env_location,
+            "#6": self._rename_env_row,
+            "#7": self._delete_env_row,
+            "#9": self._more_env_row,
+        }
 
         def on_tree_click(event):
             col = self.env_tree.identify_column(event.x)
             row = self.env_tree.identify_row(event.y)
-            recent_location = self.env_tree.item(row)['values'][3]
             if not row:
                 return
-            env = self.env_tree.item(row)['values'][0]
-
-            # 1.Environment| 2.Version | 3.VM Tool | 4.Recent Location | 5.Size | 8.Last Scanned 
-            if col in ("#1","#2", "#3", "#5", "#8"):
-                if recent_location and recent_location != "-":
-                    try:
-                        self.env_tree.selection_set(row)
-                    except Exception:
-                        pass
-                    self.selected_env_var.set(env)
-                    self.activate_button.configure(state="normal")
-                    self.dir_var.set(recent_location)
-                return
-            
-            if col == "#4":  # Recent Location
-                if recent_location and recent_location != "-":
-                    try:
-                        self.env_tree.selection_set(row)
-                    except Exception:
-                        pass
-                    self.selected_env_var.set(env)
-                    self.activate_button.configure(state="normal")
-                    self.dir_var.set(recent_location)
-
-                     # Copy location to clipboard
-                    self.clipboard_clear()
-                    self.clipboard_append(recent_location)
-                    self.update()  # ensures clipboard is updated
-                    # Log the copy action in the log window
-                    self.env_log_queue.put(f"Path:'{recent_location}' copied to clipboard!")
-                return
-
-            if col == "#6":  # Rename
-                dialog = ctk.CTkInputDialog(
-                    text=f"Enter new name for '{env}':",
-                    title="Environment Rename"
-                )
-                dialog.geometry("+%d+%d" % (self.winfo_rootx() + 600, self.winfo_rooty() + 300))
-                new_name = dialog.get_input()
-                if new_name and new_name != env:
-                    self.run_async(
-                        lambda: rename_env(
-                            env, new_name,
-                            log_callback=lambda msg: self.env_log_queue.put(msg)
-                        ),
-                        success_msg=f"Environment '{env}' renamed to '{new_name}'.",
-                        error_msg="Failed to rename environment",
-                        callback=self.refresh_env_list,
-                        py_tonic_action="rename_env",
-                    )
-            elif col == "#7":  # Delete
-                if messagebox.askyesno("Confirm", f"Delete environment '{env}'?"):
-                    self.run_async(
-                        lambda: delete_env(env, log_callback=lambda msg: self.env_log_queue.put(msg)),
-                        success_msg=f"Environment '{env}' deleted successfully.",
-                        error_msg="Failed to delete environment",
-                        callback=self.refresh_env_list,
-                        py_tonic_action="delete_env",
-                    )
-            elif col == "#9":  # More
-                self.show_more_actions_dialog(env)
+            values = self.env_tree.item(row)['values']
+            handler = self._col_handlers.get(col)
+            if handler:
+                handler(values[0], row, values[3])
 
         def on_tree_double_click(event):
             col = self.env_tree.identify_column(event.x)
@@ -1006,15 +1362,77 @@ class PyEnvStudio(ctk.CTk):
         self.env_tree.bind("<Double-1>", on_tree_double_click)
 
         def on_tree_select(event):
-            sel = self.env_tree.selection()
-            if sel:
-                env = self.env_tree.item(sel[0])['values'][0]
-                self.selected_env_var.set(env)
-                self.activate_button.configure(state="normal")
-
+            # Debounce: arrow-key navigation fires one event per row; only
+            # the selection that survives a short pause gets committed
+            if self._select_after_id is not None:
+                self.after_cancel(self._select_after_id)
+            self._select_after_id = self.after(30, self._commit_selection)
 
         self.env_tree.bind("<<TreeviewSelect>>", on_tree_select)
 
+    def _commit_selection(self):
+        self._select_after_id = None
+        sel = self.env_tree.selection()
+        if sel:
+            env = self.env_tree.item(sel[0])['values'][0]
+            self.selected_env_var.set(env)
+            self.activate_button.configure(state="normal")
+
+    # Column click handlers (dispatched from _bind_env_tree_events)
+    def _select_env_row(self, env, row, recent_location):
+        # Environment / Version / VM Tool / Size / Last Scanned columns
+        if recent_location and recent_location != "-":
+            try:
+                self.env_tree.selection_set(row)
+            except Exception:
+                pass
+            self.selected_env_var.set(env)
+            self.activate_button.configure(state="normal")
+            self.dir_var.set(recent_location)
+
+    def _copy_env_location(self, env, row, recent_location):
+        if recent_location and recent_location != "-":
+            self._select_env_row(env, row, recent_location)
+            # Copy location to clipboard; update_idletasks flushes the
+            # clipboard without processing the whole pending event queue
+            self.clipboard_clear()
+            self.clipboard_append(recent_location)
+            self.update_idletasks()
+            # Log the copy action in the log window
+            self.env_log_queue.put(f"Path:'{recent_location}' copied to clipboard!")
+
+    def _rename_env_row(self, env, row, recent_location):
+        dialog = ctk.CTkInputDialog(
+            text=f"Enter new name for '{env}':",
+            title="Environment Rename"
+        )
+        dialog.geometry("+%d+%d" % (self.winfo_rootx() + 600, self.winfo_rooty() + 300))
+        new_name = dialog.get_input()
+        if new_name and new_name != env:
+            self.run_async(
+                lambda: rename_env(
+                    env, new_name,
+                    log_callback=self._log_sink.write
+                ),
+                success_msg=f"Environment '{env}' renamed to '{new_name}'.",
+                error_msg="Failed to rename environment",
+                callback=self.refresh_env_list,
+                py_tonic_action="rename_env",
+            )
+
+    def _delete_env_row(self, env, row, recent_location):
+        if messagebox.askyesno("Confirm", f"Delete environment '{env}'?"):
+            self.run_async(
+                lambda: delete_env(env, log_callback=self._log_sink.write),
+                success_msg=f"Environment '{env}' deleted successfully.",
+                error_msg="Failed to delete environment",
+                callback=self.refresh_env_list,
+                py_tonic_action="delete_env",
+            )
+
+    def _more_env_row(self, env, row, recent_location):
+        self.show_more_actions_dialog(env)
+
     def show_more_actions_dialog(self, env_name):
         """Show the More actions dialog with Vulnerability Report and Scan Now buttons"""
         dialog = MoreActionsDialog(
@@ -1044,10 +1462,23 @@ class PyEnvStudio(ctk.CTk):
             show_error(f"Failed to show vulnerability report: {str(e)}")
 
     def launch_vulnerability_insights(self, env_name):
-        """Launch the Vulnerability Insights application."""
-        root = ctk.CTk()
-        app = VulnerabilityInsightsApp(root, env_name)
-        root.mainloop()
+        """Launch the Vulnerability Insights application.
+
+        Runs as a Toplevel on the existing mainloop; a second CTk root with
+        its own nested mainloop would block this handler and can deadlock
+        the app's event loop.
+        """
+        from py_env_studio.utils.vulneribility_insights import VulnerabilityInsightsApp
+        top = ctk.CTkToplevel(self)
+        top.transient(self)
+        VulnerabilityInsightsApp(top, env_name)
+
+    @staticmethod
+    def _warm_up_scanner():
+        try:
+            import py_env_studio.utils.vulneribility_scanner  # noqa: F401
+        except Exception as e:
+            logging.debug(f"Scanner warm-up import failed: {e}")
 
     def scan_environment_now(self, env_name):
         """Handle Scan Now action with run_async"""
@@ -1055,13 +1486,32 @@ class PyEnvStudio(ctk.CTk):
             return
 
         def scan_task():
-            # db initialization
-            db = DBHelper().init_db()
+            from py_env_studio.utils.vulneribility_scanner import DBHelper, SecurityMatrix
+            from py_env_studio.core.pip_tools import list_packages as list_env_packages
+
+            # Skip the scan when the installed package set is unchanged
+            # and the last good scan is recent; the previous results are
+            # still in the database. last_scanned is deliberately left
+            # alone here — no fresh scan happened.
+            packages = list_env_packages(env_name)
+            cache_key = _vuln_cache_key(env_name, packages)
+            if _vuln_cache_hit(env_name, cache_key):
+                self.env_log_queue.put(
+                    f"Environment '{env_name}' unchanged since last scan; reusing cached results.")
+                return
 
-            # start scan
-            scanner = SecurityMatrix()
-            if not scanner.scan_env(env_name, log_callback=lambda msg: self.env_log_queue.put(msg)):
+            # db schema init and scanner construction happen once per
+            # session, not per scan; scans run on worker threads, hence
+            # the lock around first-time setup
+            with self._scan_init_lock:
+                if self._scanner is None:
+                    DBHelper().init_db()
+                    self._scanner = SecurityMatrix()
+            scanner = self._scanner
+            if not scanner.scan_env(env_name, log_callback=self._log_sink.write,
+                                    packages=packages):
                 raise RuntimeError("Scanner failed to start.")
+            _vuln_cache_store(env_name, cache_key)
             # update last scanned time
             set_env_data(env_name, last_scanned=DT.now().isoformat())
             self.env_log_queue.put(f"Environment '{env_name}' scan completed.")
@@ -1091,8 +1541,7 @@ class PyEnvStudio(ctk.CTk):
         top.geometry(f"+{self.winfo_rootx() + 600}+{self.winfo_rooty() + 300}")
 
         # Configure grid
-        top.grid_columnconfigure(0, weight=1)
-        top.grid_rowconfigure(0, weight=1)
+        self._cfg_grid(top, cols=[(0, 1)], rows=[(0, 1)])
 
         # Treeview for updatable packages
         columns = ("PACKAGE", "CURRENT_VERSION", "NEW_VERSION")
@@ -1105,10 +1554,11 @@ class PyEnvStudio(ctk.CTk):
         ]:
             tree.heading(col, text=text)
             tree.column(col, width=width, anchor=anchor)
-        tree.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
 
+        # Insert while unmapped, then grid once
         for pkg_name, current_version, new_version, _ in updatable_packages:
             tree.insert("", "end", values=(pkg_name, current_version, new_version))
+        tree.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
 
         # select desired
         tree.bind("<Control-a>", lambda event: tree.selection_set(tree.get_children()))
@@ -1132,9 +1582,7 @@ class PyEnvStudio(ctk.CTk):
         # Button frame
         btn_frame = ctk.CTkFrame(top, fg_color="transparent")
         btn_frame.grid(row=1, column=0, pady=(0, 10), sticky="ew", padx=10)
-        btn_frame.grid_columnconfigure(0, weight=1)
-        btn_frame.grid_columnconfigure(1, weight=1)
-        btn_frame.grid_columnconfigure(2, weight=1)
+        self._cfg_grid(btn_frame, cols=[(0, 1), (1, 1), (2, 1)])
 
         # Update Selected button
         btn_update = self.btn(btn_frame, "Update Selected", update_selected_packages)
@@ -1157,18 +1605,18 @@ class PyEnvStudio(ctk.CTk):
         def task():
             try:
                 # check_outdated_packages returns a JSON string
-                result_json = check_outdated_packages(env_name, log_callback=lambda msg: self.env_log_queue.put(msg))
-                updatable_packages = []
-                if result_json:
-                    data = json.loads(result_json)
-                    # Expecting: [{"name": ..., "version": ..., "latest_version": ..., "latest_filetype": ...}, ...]
-                    for pkg in data:
-                        updatable_packages.append((
-                            pkg.get("name", ""),
-                            pkg.get("version", ""),
-                            pkg.get("latest_version", ""),
-                            pkg.get("latest_filetype", "")
-                        ))
+                result_json = check_outdated_packages(env_name, log_callback=self._log_sink.write)
+                # Expecting: [{"name": ..., "version": ..., "latest_version": ..., "latest_filetype": ...}, ...]
+                loads = orjson.loads if orjson is not None else json.loads
+                updatable_packages = [
+                    (
+                        pkg.get("name", ""),
+                        pkg.get("version", ""),
+                        pkg.get("latest_version", ""),
+                        pkg.get("latest_filetype", "")
+                    )
+                    for pkg in loads(result_json)
+                ] if result_json else []
                 self.after(0, lambda: self.show_updatable_packages(updatable_packages))
             except Exception as e:
                 self.after(0, lambda: show_error(f"Failed to check for package updates: {str(e)}"))
@@ -1199,8 +1647,27 @@ class PyEnvStudio(ctk.CTk):
             self.packages_list_frame.grid_remove()
             return
 
+        # Listing shells out to the package manager and can take seconds;
+        # run it off the Tk mainloop and populate the table back on it
+        self.btn_view_packages.configure(state="disabled")
+
+        def target():
+            try:
+                packages = list_packages(env_name)
+            except Exception as e:
+                self.after(0, lambda e=e: self._on_packages_listed(env_name, None, str(e)))
+                return
+            self.after(0, lambda: self._on_packages_listed(env_name, packages, None))
+        self._meta_pool.submit(target)
+
+    def _on_packages_listed(self, env_name, packages, error):
+        self.btn_view_packages.configure(state="normal")
+        if error is not None:
+            self.packages_list_frame.grid_remove()
+            show_error(f"Failed to list packages: {error}")
+            return
+
         try:
-            packages = list_packages(env_name)
             columns = ("PACKAGE", "VERSION", "DELETE", "UPDATE")
             self.pkg_tree = ttk.Treeview(
                 self.packages_list_frame, columns=columns, show="headings", height=10, selectmode="none"
@@ -1213,11 +1680,12 @@ class PyEnvStudio(ctk.CTk):
             ]:
                 self.pkg_tree.heading(col, text=text)
                 self.pkg_tree.column(col, width=width, anchor=anchor)
-            self.pkg_tree.grid(row=0, column=0, sticky="nsew", padx=10, pady=5)
-            self.update_treeview_style()
-
+            # Fill rows before gridding the tree so the bulk insert happens
+            # while the widget is unmapped
             for pkg_name, pkg_version in packages:
                 self.pkg_tree.insert("", "end", values=(pkg_name, pkg_version, "🗑️", "⟳"))
+            self.pkg_tree.grid(row=0, column=0, sticky="nsew", padx=10, pady=5)
+            self.update_treeview_style()
 
             def on_pkg_click(event):
                 col = self.pkg_tree.identify_column(event.x)
@@ -1251,7 +1719,7 @@ class PyEnvStudio(ctk.CTk):
             button_widget.configure(state="disabled")
         self.run_async(
             lambda: install_package(env_name, package_name,
-                                    log_callback=lambda msg: self.env_log_queue.put(msg)),
+                                    log_callback=self._log_sink.write),
             success_msg=f"Package '{package_name}' installed in '{env_name}'.",
             error_msg="Failed to install package",
             callback=lambda: [
@@ -1279,7 +1747,7 @@ class PyEnvStudio(ctk.CTk):
             return
         self.run_async(
             lambda: uninstall_package(env_name, package_name,
-                                      log_callback=lambda msg: self.env_log_queue.put(msg)),
+                                      log_callback=self._log_sink.write),
             success_msg=f"Package '{package_name}' uninstalled from '{env_name}'.",
             error_msg="Failed to uninstall package",
             callback=lambda: self.view_installed_packages(),
@@ -1289,7 +1757,7 @@ class PyEnvStudio(ctk.CTk):
     def update_installed_package(self, env_name, package_name):
         self.run_async(
             lambda: update_package(env_name, package_name,
-                                   log_callback=lambda msg: self.env_log_queue.put(msg)),
+                                   log_callback=self._log_sink.write),
             success_msg=f"Package '{package_name}' updated in '{env_name}'.",
             error_msg="Failed to update package",
             callback=lambda: self.view_installed_packages(),
@@ -1309,45 +1777,68 @@ class PyEnvStudio(ctk.CTk):
             return
 
         def task():
-            """Execute updates and collect results"""
+            """Execute updates concurrently and collect results.
+
+            Each update is subprocess/network bound, so fanning out over a
+            small pool cuts wall time roughly linearly with concurrency;
+            results are appended from the as_completed loop on this one
+            worker thread, so no locking is needed.
+
+            pip has no install lock, so concurrent upgrades touching a
+            shared dependency can corrupt site-packages — pip-managed
+            environments get one worker; uv locks, so uv keeps the pool.
+            """
             successful = []
             failed = []
-            
-            for pkg_name in package_names:
-                try:
-                    update_package(env_name, pkg_name,
-                                 log_callback=lambda msg: self.env_log_queue.put(msg))
-                    successful.append(pkg_name)
-                except Exception as e:
-                    failed.append((pkg_name, str(e)))
-                    logging.error(f"Failed to update {pkg_name}: {e}")
-            
-            return successful, failed
+
+            if get_env_package_manager(env_name) == "pip":
+                workers = 1
+            else:
+                workers = min(_BATCH_UPDATE_WORKERS, len(package_names))
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                futures = {
+                    ex.submit(update_package, env_name, pkg_name,
+                              log_callback=self._log_sink.write): pkg_name
+                    for pkg_name in package_names
+                }
+                for future in as_completed(futures):
+                    pkg_name = futures[future]
+                    try:
+                        future.result()
+                        successful.append(pkg_name)
+                    except Exception as e:
+                        failed.append((pkg_name, str(e)))
+                        logging.error(f"Failed to update {pkg_name}: {e}")
+
+            self.after(0, lambda: on_complete((successful, failed)))
 
         def on_complete(result):
             """Show summary after all updates complete"""
             if result:
                 successful, failed = result
-                
-                # Build summary message
-                summary = "Update Summary:\n\n"
-                
+
+                # Build summary message with a list + join (O(n)) and cap
+                # the listing: Tk's messagebox isn't meant for huge bodies
+                parts = ["Update Summary:\n\n"]
+
                 if successful:
-                    summary += f"✓ Updated Successfully ({len(successful)}):\n"
-                    for pkg in successful:
-                        summary += f"  • {pkg}\n"
-                
+                    parts.append(f"✓ Updated Successfully ({len(successful)}):\n")
+                    parts.extend(f"  • {pkg}\n" for pkg in successful[:50])
+                    if len(successful) > 50:
+                        parts.append(f"  ...and {len(successful) - 50} more\n")
+
                 if failed:
-                    summary += f"\n✗ Failed ({len(failed)}):\n"
-                    for pkg, error in failed:
-                        summary += f"  • {pkg}\n"
-                
+                    parts.append(f"\n✗ Failed ({len(failed)}):\n")
+                    parts.extend(f"  • {pkg}\n" for pkg, error in failed[:50])
+                    if len(failed) > 50:
+                        parts.append(f"  ...and {len(failed) - 50} more\n")
+
                 # Close parent window if provided
                 if parent_window:
                     parent_window.destroy()
-                
+
                 # Show summary
-                messagebox.showinfo("Update Summary", summary)
+                messagebox.showinfo("Update Summary", "".join(parts))
                 
                 # Refresh package list
                 self.view_installed_packages()
@@ -1356,21 +1847,39 @@ class PyEnvStudio(ctk.CTk):
             task,
             success_msg=None,
             error_msg=None,
-            callback=on_complete
+            callback=None
         )
 
+    def _ask_file_async(self, opener, callback, **options):
+        """Run a filedialog opener off the main thread and hand the chosen
+        path to ``callback`` on the Tk loop.
+
+        On Windows the first dialog open can stall for seconds while the
+        shell namespace initializes; moving it to a worker thread keeps
+        the UI responsive in the meantime."""
+        def ask():
+            path = opener(**options)
+            self.after(0, lambda: callback(path))
+        threading.Thread(target=ask, daemon=True).start()
+
     # ===== BULK OPS =====
     def install_requirements(self):
         env_name = self.selected_env_var.get().strip()
         if not is_valid_env_selected(env_name):
             show_error("Please select a valid environment.")
             return
-        file_path = filedialog.askopenfilename(filetypes=[("Text files", "*.txt")])
+        self._ask_file_async(
+            filedialog.askopenfilename,
+            lambda path: self._install_requirements_from(env_name, path),
+            filetypes=[("Text files", "*.txt")],
+        )
+
+    def _install_requirements_from(self, env_name, file_path):
         if file_path:
             self.btn_install_requirements.configure(state="disabled")
             self.run_async(
                 lambda: import_requirements(env_name, file_path,
-                                            log_callback=lambda msg: self.env_log_queue.put(msg)),
+                                            log_callback=self._log_sink.write),
                 success_msg=f"Requirements from '{file_path}' installed in '{env_name}'.",
                 error_msg="Failed to install requirements",
                 callback=lambda: self.btn_install_requirements.configure(state="normal"),
@@ -1382,7 +1891,14 @@ class PyEnvStudio(ctk.CTk):
         if not is_valid_env_selected(env_name):
             show_error("Please select a valid environment.")
             return
-        file_path = filedialog.asksaveasfilename(defaultextension=".txt", filetypes=[("Text files", "*.txt")])
+        self._ask_file_async(
+            filedialog.asksaveasfilename,
+            lambda path: self._export_packages_to(env_name, path),
+            defaultextension=".txt",
+            filetypes=[("Text files", "*.txt")],
+        )
+
+    def _export_packages_to(self, env_name, file_path):
         if file_path:
             self.run_async(
                 lambda: export_requirements(env_name, file_path),
@@ -1402,7 +1918,7 @@ class PyEnvStudio(ctk.CTk):
             return
         self.activate_button.configure(state="disabled")
         self.run_async(
-            lambda: activate_env(env, directory, open_with, log_callback=lambda msg: self.env_log_queue.put(msg)),
+            lambda: activate_env(env, directory, open_with, log_callback=self._log_sink.write),
             success_msg=f"Environment '{env}' activated successfully in {open_with}.",
             error_msg="Failed to activate environment",
             callback=lambda: self.activate_button.configure(state="normal"),
@@ -1437,10 +1953,14 @@ class PyEnvStudio(ctk.CTk):
             self.choosen_python_var.set("")
             self.show_detected_version(choice)
             return
-        selected = filedialog.askopenfilename(
+        self._ask_file_async(
+            filedialog.askopenfilename,
+            self._apply_python_path,
             title="Select Python Interpreter",
-            filetypes=[("Python Executable", "python.exe"), ("All Files", "*")]
+            filetypes=[("Python Executable", "python.exe"), ("All Files", "*")],
         )
+
+    def _apply_python_path(self, selected):
         if selected:
             self.entry_python_path.delete(0, tkinter.END)
             self.entry_python_path.insert(0, selected)
@@ -1448,11 +1968,19 @@ class PyEnvStudio(ctk.CTk):
             self.show_detected_version(selected)
 
     def browse_dir(self):
-        selected = filedialog.askdirectory()
+        self._ask_file_async(filedialog.askdirectory, self._apply_browsed_dir)
+
+    def _apply_browsed_dir(self, selected):
         if selected:
             self.dir_var.set(selected)
 
     def change_appearance_mode_event(self, new_appearance_mode: str):
+        # Compare against the last mode we set, not get_appearance_mode():
+        # that resolves "System" to the effective Light/Dark, which would
+        # swallow an explicit pin matching the current OS theme
+        if new_appearance_mode == self._last_set_appearance:
+            return
+        self._last_set_appearance = new_appearance_mode
         ctk.set_appearance_mode(new_appearance_mode)
         self.update_treeview_style()
         self.refresh_env_list()
@@ -1463,7 +1991,14 @@ class PyEnvStudio(ctk.CTk):
     def on_tab_changed(self):
         if self.tabview.get() == "Packages":
             env_name = self.selected_env_var.get().strip()
-            if is_valid_env_selected(env_name):
+            valid = is_valid_env_selected(env_name)
+            # Re-clicking the same tab with the same selection would only
+            # repeat the configure/grid_remove and force a Tk relayout
+            state = ("Packages", env_name, valid)
+            if state == self._last_tab_state:
+                return
+            self._last_tab_state = state
+            if valid:
                 self.selected_env_label.configure(
                     text=f"Selected Environment: {env_name}",
                     text_color=self.theme.HIGHLIGHT_COLOR,
@@ -1491,13 +2026,12 @@ class PyEnvStudio(ctk.CTk):
         selected_pkg_mgr = self.create_env_pkg_mgr.get()
         
         # Temporarily set the preference to use in create_env function
-        from py_env_studio.core.env_manager import set_preferred_package_manager
         set_preferred_package_manager(selected_pkg_mgr)
         
         self.btn_create_env.configure(state="disabled")
         self.run_async(
             lambda: create_env(env_name, python_path, bool(self.checkbox_upgrade_pip.get()),
-                               log_callback=lambda msg: self.env_log_queue.put(msg)),
+                               log_callback=self._log_sink.write),
             success_msg=f"Environment '{env_name}' created successfully.",
             error_msg="Failed to create environment",
             callback=lambda: [
@@ -1546,8 +2080,7 @@ class PyEnvStudio(ctk.CTk):
         top.geometry("700x500")
         top.transient(self)
         top.grab_set()
-        top.grid_columnconfigure(0, weight=1)
-        top.grid_rowconfigure(1, weight=1)
+        self._cfg_grid(top, cols=[(0, 1)], rows=[(1, 1)])
         top.geometry(f"+{self.winfo_rootx() + 300}+{self.winfo_rooty() + 150}")
 
         # Title
@@ -1563,36 +2096,17 @@ class PyEnvStudio(ctk.CTk):
         list_frame.grid(row=1, column=0, padx=16, pady=8, sticky="nsew")
         list_frame.grid_columnconfigure(0, weight=1)
 
-        # Discover plugins
-        discovered = self.plugin_manager.discover_plugins()
-        loaded = self.plugin_manager.get_all_plugins()
-
-        if not discovered and not loaded:
-            label = ctk.CTkLabel(
-                list_frame,
-                text="No plugins found.\n\nPlace plugins in: ~/.py_env_studio/plugins/",
-                text_color=self.theme.TEXT_COLOR_LIGHT
-            )
-            label.pack(padx=20, pady=20)
-        else:
-            # Show loaded plugins
-            for plugin_name, plugin in loaded.items():
-                self._create_plugin_item(
-                    list_frame,
-                    plugin_name,
-                    plugin,
-                    is_loaded=True
-                )
+        # Discover plugins (plugin setup is deferred to the idle queue, so
+        # make sure it has run before the dialog reads from it)
+        if self.plugin_manager is None:
+            self._setup_plugins()
 
-            # Show discovered but not loaded plugins
-            for plugin_name in discovered:
-                if plugin_name not in loaded:
-                    self._create_plugin_item(
-                        list_frame,
-                        plugin_name,
-                        None,
-                        is_loaded=False
-                    )
+        # Widgets per plugin, so enable/disable can restyle items in place
+        # instead of tearing the whole dialog down
+        self._plugin_items = {}
+        self._plugins_list_frame = list_frame
+        self._plugins_empty_label = None
+        self._populate_plugins_dialog()
 
         # Footer buttons
         footer = ctk.CTkFrame(top)
@@ -1612,6 +2126,64 @@ class PyEnvStudio(ctk.CTk):
         close_btn = self.btn(footer, "Close", top.destroy, width=120)
         close_btn.grid(row=0, column=2, padx=4, sticky="e")
 
+    def _populate_plugins_dialog(self):
+        """Sync the plugin list with the manager, reusing existing items."""
+        discovered = self.plugin_manager.discover_plugins()
+        loaded = self.plugin_manager.get_all_plugins()
+
+        if not discovered and not loaded:
+            if self._plugins_empty_label is None:
+                self._plugins_empty_label = ctk.CTkLabel(
+                    self._plugins_list_frame,
+                    text="No plugins found.\n\nPlace plugins in: ~/.py_env_studio/plugins/",
+                    text_color=self.theme.TEXT_COLOR_LIGHT
+                )
+                self._plugins_empty_label.pack(padx=20, pady=20)
+            return
+
+        if self._plugins_empty_label is not None:
+            self._plugins_empty_label.destroy()
+            self._plugins_empty_label = None
+
+        # Loaded plugins first, then discovered-but-not-loaded ones
+        current = dict.fromkeys(loaded)
+        current.update(dict.fromkeys(n for n in discovered if n not in loaded))
+
+        for name in list(self._plugin_items):
+            if name not in current:
+                self._plugin_items.pop(name)["frame"].destroy()
+
+        for plugin_name in current:
+            is_loaded = plugin_name in loaded
+            item = self._plugin_items.get(plugin_name)
+            if item is None:
+                self._create_plugin_item(
+                    self._plugins_list_frame,
+                    plugin_name,
+                    loaded.get(plugin_name),
+                    is_loaded=is_loaded
+                )
+            elif item["loaded"] != is_loaded:
+                self._update_plugin_item(plugin_name, item, is_loaded)
+
+    def _update_plugin_item(self, plugin_name, item, is_loaded):
+        """Restyle an existing plugin item after an enable/disable flip."""
+        top = self._plugins_list_frame.winfo_toplevel()
+        if is_loaded:
+            status = "✓ Loaded"
+            status_color = self.theme.SUCCESS_COLOR
+            btn_text = "Disable"
+            command = lambda: self._unload_plugin_and_refresh(plugin_name, top=top)
+        else:
+            status = "○ Not Loaded"
+            status_color = self.theme.TEXT_COLOR_LIGHT
+            btn_text = "Enable"
+            command = lambda: self._load_plugin_and_refresh(plugin_name, top=top)
+        item["status_label"].configure(
+            text=f"by {item['author']} • {status}", text_color=status_color)
+        item["button"].configure(text=btn_text, command=command)
+        item["loaded"] = is_loaded
+
     def _create_plugin_item(self, parent, plugin_name, plugin, is_loaded):
         """Create a plugin list item.
         
@@ -1621,77 +2193,82 @@ class PyEnvStudio(ctk.CTk):
             plugin: Plugin instance or None
             is_loaded: Whether plugin is currently loaded
         """
+        t = self.theme
         # Get metadata
         if is_loaded:
             metadata = plugin.get_metadata()
             status = "✓ Loaded"
-            status_color = self.theme.SUCCESS_COLOR
+            status_color = t.SUCCESS_COLOR
         else:
-            # Try to load metadata from manifest
-            from pathlib import Path
-            manifest_file = Path.home() / ".py_env_studio" / "plugins" / plugin_name / "plugin.json"
-            if manifest_file.exists():
-                try:
-                    import json
-                    manifest = json.loads(manifest_file.read_text())
-                    metadata = self.plugin_manager._manifest_to_metadata(manifest)
-                    status = "○ Not Loaded"
-                    status_color = self.theme.TEXT_COLOR_LIGHT
-                except Exception as e:
-                    logging.error(f"Failed to load metadata for {plugin_name}: {e}")
-                    return
-            else:
+            # Manifest comes from the manager's mtime-keyed cache, so dialog
+            # opens don't re-read plugin.json for every unloaded plugin
+            manifest = self.plugin_manager.get_manifest(plugin_name)
+            if manifest is None:
+                return
+            try:
+                metadata = self.plugin_manager._manifest_to_metadata(manifest)
+                status = "○ Not Loaded"
+                status_color = t.TEXT_COLOR_LIGHT
+            except Exception as e:
+                logging.error(f"Failed to load metadata for {plugin_name}: {e}")
                 return
 
         # Create item frame
-        item_frame = ctk.CTkFrame(parent, corner_radius=8, border_width=1, border_color=self.theme.BORDER_COLOR)
+        item_frame = _CTKFRAME(parent, corner_radius=8, border_width=1, border_color=t.BORDER_COLOR)
         item_frame.pack(padx=0, pady=8, fill="x")
         item_frame.grid_columnconfigure(1, weight=1)
 
         # Plugin info
         info_text = f"{metadata.name} v{metadata.version}"
-        info_label = ctk.CTkLabel(
+        info_label = _CTKLABEL(
             item_frame,
             text=info_text,
-            font=("Segoe UI", 12, "bold")
+            font=_PLUGIN_TITLE_FONT
         )
         info_label.grid(row=0, column=0, columnspan=3, padx=12, pady=(8, 4), sticky="w")
 
         # Description
-        desc_label = ctk.CTkLabel(
+        desc_label = _CTKLABEL(
             item_frame,
             text=metadata.description,
-            text_color=self.theme.TEXT_COLOR_LIGHT
+            text_color=t.TEXT_COLOR_LIGHT
         )
         desc_label.grid(row=1, column=0, columnspan=3, padx=12, pady=(0, 4), sticky="ew")
 
         # Author and status
         author_status = f"by {metadata.author} • {status}"
-        author_label = ctk.CTkLabel(
+        author_label = _CTKLABEL(
             item_frame,
             text=author_status,
             text_color=status_color,
-            font=("Segoe UI", 10)
+            font=_PLUGIN_SMALL_FONT
         )
         author_label.grid(row=2, column=0, columnspan=3, padx=12, pady=(0, 8), sticky="w")
 
         # Buttons
         if is_loaded:
-            unload_btn = self.btn(
+            action_btn = self.btn(
                 item_frame,
                 "Disable",
                 lambda: self._unload_plugin_and_refresh(plugin_name, top=parent.winfo_toplevel()),
                 width=80
             )
-            unload_btn.grid(row=0, column=3, rowspan=3, padx=(12, 8), pady=8)
         else:
-            load_btn = self.btn(
+            action_btn = self.btn(
                 item_frame,
                 "Enable",
                 lambda: self._load_plugin_and_refresh(plugin_name, top=parent.winfo_toplevel()),
                 width=80
             )
-            load_btn.grid(row=0, column=3, rowspan=3, padx=(12, 8), pady=8)
+        action_btn.grid(row=0, column=3, rowspan=3, padx=(12, 8), pady=8)
+
+        self._plugin_items[plugin_name] = {
+            "frame": item_frame,
+            "status_label": author_label,
+            "button": action_btn,
+            "author": metadata.author,
+            "loaded": is_loaded,
+        }
 
     def _load_plugin_and_refresh(self, plugin_name, top):
         """Load plugin and refresh dialog."""
@@ -1716,21 +2293,35 @@ class PyEnvStudio(ctk.CTk):
             show_error(f"Failed to unload plugin '{plugin_name}':\n{str(e)}")
 
     def _reload_plugins_dialog(self, top):
-        """Reload the plugins dialog."""
-        top.destroy()
-        self.show_plugins_dialog()
+        """Refresh the plugins dialog in place."""
+        if not top.winfo_exists():
+            self.show_plugins_dialog()
+            return
+        self._populate_plugins_dialog()
 
     def on_closing(self):
         """Handle application shutdown - cleanup plugins."""
         try:
             # Execute on_app_shutdown hook for all loaded plugins
-            self.plugin_manager.execute_hook("on_app_shutdown", {
-                "version": self.version
-            })
-            logging.info("✓ Executed on_app_shutdown hook for all plugins")
+            if self.plugin_manager is not None:
+                self.plugin_manager.execute_hook("on_app_shutdown", {
+                    "version": self.version
+                })
+                logging.info("✓ Executed on_app_shutdown hook for all plugins")
         except Exception as e:
             logging.error(f"Error executing on_app_shutdown hook: {e}")
-        
+
+        # concurrent.futures joins its non-daemon workers at interpreter
+        # exit; abandon the pools so closing mid-install doesn't leave a
+        # windowless process waiting for the subprocess to finish
+        # (cancel_futures is 3.9+; 3.8 still gets the shutdown)
+        shutdown_kwargs = {"cancel_futures": True} if sys.version_info >= (3, 9) else {}
+        for pool in (self._discovery_pool, self._io_pool, self._meta_pool):
+            try:
+                pool.shutdown(wait=False, **shutdown_kwargs)
+            except Exception as e:
+                logging.error(f"Error shutting down worker pool: {e}")
+
         self.destroy()
 
 # ===== RUN APP =====
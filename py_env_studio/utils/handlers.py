@@ -4,38 +4,94 @@ from datetime import datetime
 import json
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Shared (de)serializers: orjson works in bytes, so files are opened in
+# binary mode and the stdlib fallback encodes to match
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(obj):
+        return orjson.dumps(obj)
+else:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
 from py_env_studio.core.database import DatabaseManager
 from py_env_studio.core.env_manager import DB_FILE, MATRIX_FILE, VENV_DIR
 
+# Append-only vulnerability log: one JSON record per line, so saving a
+# scan no longer rewrites the whole matrix file
+VULN_LOG_FILE = MATRIX_FILE + ".jsonl"
+
 
 class DataHelper:
     """Operations in JSON file (acts like DBHelper but with JSON)."""
 
+    # Parsed matrix cache keyed on file mtime: repeated reads skip the
+    # full JSON parse, which grows with the vulnerability history
+    _cache = {"mtime": None, "data": None}
+    # env_name -> env_id index rebuilt whenever the matrix is (re)parsed
+    _env_index = {}
+
     @staticmethod
     def _load_data():
-        if not os.path.exists(MATRIX_FILE):
-            return {"environments": [], "env_vulnerability_info": []}
+        try:
+            mtime = os.stat(MATRIX_FILE).st_mtime_ns
+        except OSError:
+            DataHelper._env_index = {}
+            return {"environments": [], "env_vulnerability_info": [], "_next_env_id": 1}
+
+        if mtime == DataHelper._cache["mtime"]:
+            return DataHelper._cache["data"]
 
-        with open(MATRIX_FILE, "r", encoding="utf-8") as handle:
+        with open(MATRIX_FILE, "rb") as handle:
             try:
-                return json.load(handle)
-            except json.JSONDecodeError:
-                return {"environments": [], "env_vulnerability_info": []}
+                data = _loads(handle.read())
+            except ValueError:
+                DataHelper._env_index = {}
+                return {"environments": [], "env_vulnerability_info": [], "_next_env_id": 1}
+
+        # Backfill the counter on files written before it was persisted
+        if "_next_env_id" not in data:
+            data["_next_env_id"] = max(
+                (env["env_id"] for env in data.get("environments", [])), default=0
+            ) + 1
+
+        DataHelper._cache = {"mtime": mtime, "data": data}
+        DataHelper._env_index = {
+            env["env_name"]: env["env_id"] for env in data.get("environments", [])
+        }
+        return data
 
     @staticmethod
     def _save_data(data):
-        with open(MATRIX_FILE, "w", encoding="utf-8") as handle:
-            json.dump(data, handle, indent=4)
+        # Compact encoding: fewer bytes to write now and to parse later
+        with open(MATRIX_FILE, "wb") as handle:
+            handle.write(_dumps(data))
+        try:
+            DataHelper._cache = {"mtime": os.stat(MATRIX_FILE).st_mtime_ns, "data": data}
+        except OSError:
+            DataHelper._cache = {"mtime": None, "data": None}
 
     @staticmethod
     def get_or_create_env(env_name, env_path):
+        env_name = env_name.strip()
         data = DataHelper._load_data()
 
-        for env in data["environments"]:
-            if env["env_name"] == env_name:
-                return env["env_id"]
+        env_id = DataHelper._env_index.get(env_name)
+        if env_id is not None:
+            return env_id
 
-        new_id = len(data["environments"]) + 1
+        # Persisted monotonic counter: ids stay unique even after entries
+        # are deleted, unlike len(environments) + 1
+        new_id = data["_next_env_id"]
+        data["_next_env_id"] = new_id + 1
         data["environments"].append(
             {
                 "env_id": new_id,
@@ -43,31 +99,84 @@ class DataHelper:
                 "env_path": env_path,
             }
         )
+        DataHelper._env_index[env_name] = new_id
         DataHelper._save_data(data)
         return new_id
 
+    # Next vid for the append-only log; loaded once, bumped per append
+    _next_vid = None
+    # Parsed log cache keyed on file mtime, mirroring the matrix cache:
+    # repeated reads between appends skip re-parsing every line
+    _log_cache = {"mtime": None, "records": None}
+
     @staticmethod
-    def save_vulnerability_info(env_id, vulnerabilities_json):
-        data = DataHelper._load_data()
+    def _read_vuln_log():
+        try:
+            mtime = os.stat(VULN_LOG_FILE).st_mtime_ns
+        except OSError:
+            return []
 
-        new_vid = len(data["env_vulnerability_info"]) + 1
-        data["env_vulnerability_info"].append(
-            {
-                "vid": new_vid,
-                "env_id": env_id,
-                "vulnerabilities": vulnerabilities_json,
-            }
-        )
-        DataHelper._save_data(data)
+        if mtime == DataHelper._log_cache["mtime"]:
+            return DataHelper._log_cache["records"]
+
+        records = []
+        try:
+            with open(VULN_LOG_FILE, "rb") as handle:
+                for line in handle:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        records.append(_loads(line))
+                    except ValueError:
+                        continue
+        except OSError:
+            return []
+        DataHelper._log_cache = {"mtime": mtime, "records": records}
+        return records
+
+    @staticmethod
+    def _allocate_vid():
+        if DataHelper._next_vid is None:
+            legacy = DataHelper._load_data()["env_vulnerability_info"]
+            logged = DataHelper._read_vuln_log()
+            DataHelper._next_vid = max(
+                [record.get("vid", 0) for record in legacy + logged] or [0]
+            ) + 1
+        vid = DataHelper._next_vid
+        DataHelper._next_vid += 1
+        return vid
+
+    @staticmethod
+    def save_vulnerability_info(env_id, vulnerabilities_json):
+        # O(1) append: one line per scan, no read-rewrite of the history
+        record = {
+            "vid": DataHelper._allocate_vid(),
+            "env_id": env_id,
+            "vulnerabilities": vulnerabilities_json,
+        }
+        with open(VULN_LOG_FILE, "ab") as handle:
+            handle.write(_dumps(record) + b"\n")
+        # Keep the parse cache warm: extend it with the new record rather
+        # than letting the mtime change force a full re-parse
+        if DataHelper._log_cache["records"] is not None:
+            DataHelper._log_cache["records"].append(record)
+            try:
+                DataHelper._log_cache["mtime"] = os.stat(VULN_LOG_FILE).st_mtime_ns
+            except OSError:
+                DataHelper._log_cache = {"mtime": None, "records": None}
 
     @staticmethod
     def get_vulnerability_info(env_id):
-        data = DataHelper._load_data()
-        results = [record for record in data["env_vulnerability_info"] if record["env_id"] == env_id]
+        # Legacy records from the matrix file plus the append-only log
+        records = DataHelper._load_data()["env_vulnerability_info"] + DataHelper._read_vuln_log()
+        results = [record for record in records if record["env_id"] == env_id]
         return results if results else None
 
 
 class DBHelper:
+    # Connections are cached per thread by the manager, so helpers just
+    # grab the current thread's connection instead of opening one per call
     _dbm = DatabaseManager()
 
     @staticmethod
@@ -77,50 +186,76 @@ class DBHelper:
     @staticmethod
     def get_or_create_env(env_name):
         env_path = os.path.join(VENV_DIR, env_name)
-        with DBHelper._dbm.connect() as conn:
-            cur = conn.cursor()
-            cur.execute("SELECT env_id FROM environments WHERE env_name=?", (env_name,))
-            row = cur.fetchone()
-            if row:
-                return row[0]
-
-            cur.execute(
-                "INSERT INTO environments (env_name, env_path, created_at) VALUES (?, ?, ?)",
-                (env_name, env_path, datetime.now()),
-            )
+        conn = DBHelper._dbm.connect()
+        # INSERT OR IGNORE + SELECT instead of RETURNING: the latter
+        # needs SQLite >= 3.35, newer than what older supported CPython
+        # builds bundle on Windows
+        cur = conn.execute(
+            "INSERT OR IGNORE INTO environments (env_name, env_path, created_at) VALUES (?, ?, ?)",
+            (env_name, env_path, datetime.now()),
+        )
+        if cur.rowcount:
             conn.commit()
-            return cur.lastrowid
+        env_id = conn.execute(
+            "SELECT env_id FROM environments WHERE env_name=?", (env_name,)
+        ).fetchone()[0]
+        return env_id
 
     @staticmethod
     def save_vulnerability_info(env_id, vulnerabilities_json):
-        with DBHelper._dbm.connect() as conn:
-            cur = conn.cursor()
-            cur.execute(
-                "INSERT INTO env_vulnerability_info (env_id, vulnerabilities, created_at) VALUES (?, ?, ?)",
-                (env_id, json.dumps(vulnerabilities_json), datetime.now()),
-            )
-            conn.commit()
+        conn = DBHelper._dbm.connect()
+        conn.execute(
+            "INSERT INTO env_vulnerability_info (env_id, vulnerabilities, created_at) VALUES (?, ?, ?)",
+            (env_id, _dumps(vulnerabilities_json).decode("utf-8"), datetime.now()),
+        )
+        conn.commit()
 
     @staticmethod
-    def get_vulnerability_info(env_name):
-        with DBHelper._dbm.connect() as conn:
-            cur = conn.cursor()
-            cur.execute(
-                """
-                SELECT evi.vid, evi.vulnerabilities
-                FROM env_vulnerability_info evi
-                JOIN environments e ON evi.env_id = e.env_id
-                WHERE e.env_name=?
-                AND DATE(evi.created_at) = (
-                    SELECT MAX(DATE(created_at))
-                    FROM env_vulnerability_info
-                    WHERE env_id = evi.env_id
+    def save_vulnerability_info_bulk(rows):
+        """Insert many (env_id, vulnerabilities_json) rows in one transaction.
+
+        One executemany and one commit (one fsync) instead of a
+        transaction per package scan. Payloads may be pre-encoded JSON
+        strings, letting callers serialize on their worker threads and
+        keep the insert loop free of encoding work.
+        """
+        if not rows:
+            return
+        now = datetime.now()
+        conn = DBHelper._dbm.connect()
+        conn.executemany(
+            "INSERT INTO env_vulnerability_info (env_id, vulnerabilities, created_at) VALUES (?, ?, ?)",
+            (
+                (
+                    env_id,
+                    payload if isinstance(payload, str) else _dumps(payload).decode("utf-8"),
+                    now,
                 )
-                ORDER BY evi.vid ASC
-                """,
-                (env_name,),
+                for env_id, payload in rows
+            ),
+        )
+        conn.commit()
+
+    @staticmethod
+    def get_vulnerability_info(env_name):
+        cur = DBHelper._dbm.connect().execute(
+            """
+            WITH latest AS (
+                SELECT env_id, MAX(DATE(created_at)) AS scan_date
+                FROM env_vulnerability_info
+                GROUP BY env_id
             )
-            rows = cur.fetchall()
+            SELECT evi.vid, evi.vulnerabilities
+            FROM env_vulnerability_info evi
+            JOIN environments e ON evi.env_id = e.env_id
+            JOIN latest l ON l.env_id = evi.env_id
+                AND DATE(evi.created_at) = l.scan_date
+            WHERE e.env_name=?
+            ORDER BY evi.vid ASC
+            """,
+            (env_name,),
+        )
+        rows = cur.fetchall()
 
         if not rows:
             return {"vulnerability_insights": []}
@@ -128,7 +263,7 @@ class DBHelper:
         buckets = {}
         for vid, payload in rows:
             try:
-                decoded = json.loads(payload) if isinstance(payload, str) else payload
+                decoded = _loads(payload) if isinstance(payload, str) else payload
             except Exception:
                 continue
             buckets[str(vid)] = decoded.get("vulnerability_insights", decoded)
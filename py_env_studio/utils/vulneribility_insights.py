@@ -1,4 +1,5 @@
 import json
+import tkinter
 import webbrowser
 import customtkinter as ctk
 from tkinter import ttk
@@ -40,7 +41,10 @@ class VulnerabilityInsightsApp:
     # ---------------------- Core Methods ----------------------
 
     def _on_close(self):
-        self.root.quit()
+        # quit() would stop the caller's mainloop when root is a Toplevel
+        # hosted by the main app; only a standalone root owns a loop to quit
+        if not isinstance(self.root, tkinter.Toplevel):
+            self.root.quit()
         self.root.destroy()
 
     def _packages_map(self):
@@ -1,11 +1,55 @@
+import atexit
 import os
 import requests
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
 from cvss import CVSS3
-from .handlers import DBHelper
+from requests.adapters import HTTPAdapter, Retry
+from .handlers import DBHelper, _dumps
 from py_env_studio.core.env_manager import VENV_DIR, DB_FILE
 from py_env_studio.core.pip_tools import list_packages
 
+# (connect, read) timeouts so a stalled API can't hang a scan worker
+_REQUEST_TIMEOUT = (3, 10)
+
+# CVSS v3 base score to severity level, indexed in tenths of a point:
+# 0.0-3.9 Low, 4.0-6.9 Medium, 7.0-8.9 High, 9.0-10.0 Critical.
+# A table lookup replaces the if/elif ladder per vulnerability.
+_SEVERITY_TABLE = ["Low"] * 40 + ["Medium"] * 30 + ["High"] * 20 + ["Critical"] * 11
+
+
+def _make_session():
+    """Session with a pooled HTTPS adapter and retry policy.
+
+    Reusing connections skips the TCP+TLS handshake per request, which
+    dominates latency when scanning many packages against the same hosts.
+    """
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.3,
+                          status_forcelist=(429, 500, 502, 503, 504)),
+    ))
+    atexit.register(session.close)
+    return session
+
+
+@lru_cache(maxsize=1024)
+def _cvss_level(vector):
+    """Severity level for a CVSS v3 vector, or None if it won't parse.
+
+    Vector parsing dominates the per-vulnerability cost and the same
+    vectors recur across packages, so results are memoized.
+    """
+    try:
+        score = CVSS3(vector).base_score
+    except Exception:
+        return None
+    return _SEVERITY_TABLE[min(100, int(score * 10))]
+
 # ===================== Helpers =====================
 class Helpers:
     pass
@@ -13,13 +57,22 @@ class Helpers:
 class PyPIAPI:
     BASE_URL = "https://pypi.org/pypi/"
 
+    def __init__(self):
+        # Responses per (package, version): shared deps across envs are
+        # asked for once per process instead of once per scan
+        self._cache = {}
+        self.session = _make_session()
+
     def get_deprecation_eol(self, package, version=None):
         """
         Fetch deprecation and EOL insights for a package (and optionally a version) from PyPI.
         Returns a dict with 'deprecated', 'yanked', 'eol', and 'classifiers' info.
         """
+        cached = self._cache.get((package, version))
+        if cached is not None:
+            return cached
         url = f"{self.BASE_URL}{package}/json"
-        response = requests.get(url)
+        response = self.session.get(url, timeout=_REQUEST_TIMEOUT)
         if response.status_code != 200:
             return {"deprecated": False, "yanked": False, "eol": False, "classifiers": []}
         data = response.json()
@@ -40,28 +93,37 @@ class PyPIAPI:
             for file in releases[version]:
                 if file.get("yanked", False):
                     yanked = True
-        return {
+        result = {
             "deprecated": deprecated,
             "yanked": yanked,
             "eol": eol,
             "classifiers": classifiers
         }
+        self._cache[(package, version)] = result
+        return result
 
 class DepsDevAPI:
     BASE_URL = "https://api.deps.dev/v3alpha/systems/"
 
+    def __init__(self):
+        self._cache = {}
+        self.session = _make_session()
+
     def get_dependencies(self, package, version):
         """
         Fetch direct dependencies for a specific package and version from deps.dev.
         Returns a list of (dep_name, dep_version) tuples.
         """
+        cached = self._cache.get((package, version))
+        if cached is not None:
+            return cached
 
         url = f"{self.BASE_URL}pypi/packages/{package}/versions/{version}:dependencies"
-        response = requests.get(url)
-        
+        response = self.session.get(url, timeout=_REQUEST_TIMEOUT)
+
         if response.status_code != 200:
             return []
-        
+
         data = response.json()
 
         deps = []
@@ -71,43 +133,82 @@ class DepsDevAPI:
                 dep_version = node["versionKey"].get("version")
                 if dep_key and dep_version:
                     deps.append((dep_key, dep_version))
+        self._cache[(package, version)] = deps
         return deps
 
 class OSVAPI:
     BASE_URL = "https://api.osv.dev/v1/query"
+    BATCH_URL = "https://api.osv.dev/v1/querybatch"
+    # querybatch accepts up to 1000 queries per request
+    BATCH_LIMIT = 1000
+
+    def __init__(self):
+        self._cache = {}
+        self.session = _make_session()
+
     def get_vulnerabilities(self, package, version):
+        cached = self._cache.get((package, version))
+        if cached is not None:
+            return cached
         payload = {"package": {"name": package, "ecosystem": "PyPI"}, "version": version}
-        r = requests.post(self.BASE_URL, json=payload)
+        r = self.session.post(self.BASE_URL, json=payload, timeout=_REQUEST_TIMEOUT)
         if r.status_code != 200:
             return []
-        vulns = r.json().get("vulns", [])
+        parsed = self._parse_vulns(package, r.json().get("vulns", []))
+        self._cache[(package, version)] = parsed
+        return parsed
+
+    def get_vulnerabilities_batch(self, pairs):
+        """Prefilter many (package, version) pairs with one querybatch POST
+        per 1000 queries.
+
+        querybatch only returns {id, modified} stubs, not full advisory
+        records, so it can't feed _parse_vulns directly. It is still a
+        reliable way to prove a package clean: pairs whose entry has no
+        vulns map to []. Pairs with vulns — and every pair in a failed
+        chunk — are left out of the dict, so callers fall back to the
+        detailed per-package query for exactly those.
+
+        Returns a dict mapping each vulnerability-free pair to [].
+        """
+        results = {}
+        for start in range(0, len(pairs), self.BATCH_LIMIT):
+            chunk = pairs[start:start + self.BATCH_LIMIT]
+            payload = {
+                "queries": [
+                    {"package": {"name": name, "ecosystem": "PyPI"}, "version": version}
+                    for name, version in chunk
+                ]
+            }
+            r = self.session.post(self.BATCH_URL, json=payload, timeout=_REQUEST_TIMEOUT)
+            if r.status_code != 200:
+                continue
+            for pair, entry in zip(chunk, r.json().get("results", [])):
+                if entry.get("vulns"):
+                    continue
+                results[pair] = []
+                self._cache[pair] = []
+        return results
+
+    def _parse_vulns(self, package, vulns):
         results = []
         for v in vulns:
             refs = [r["url"] for r in v.get("references", []) if r.get("url")]
-            fixed_version = (
-                v.get("affected", [{}])[0]
-                .get("ranges", [{}])[0]
-                .get("events", [{}])[-1]
-                .get("fixed")
-            )
+            # Direct indexing with one guard beats the chained
+            # .get(..., [{}])[0] defaults, which allocated a throwaway
+            # dict/list per level and still raised on empty lists
+            try:
+                fixed_version = v["affected"][0]["ranges"][0]["events"][-1].get("fixed")
+            except (KeyError, IndexError, TypeError):
+                fixed_version = None
             fixed_versions = [fixed_version] if fixed_version else []
             severity = v.get("severity", [])
             severity_level = "Unknown"
             for s in severity:
                 if s.get("type") == "CVSS_V3":
-                    try:
-                        cvss = CVSS3(s.get("score"))
-                        score = cvss.base_score
-                        if score >= 9.0:
-                            severity_level = "Critical"
-                        elif score >= 7.0:
-                            severity_level = "High"
-                        elif score >= 4.0:
-                            severity_level = "Medium"
-                        else:
-                            severity_level = "Low"
-                    except:
-                        pass
+                    level = _cvss_level(s.get("score"))
+                    if level is not None:
+                        severity_level = level
             results.append({
                 "vulnerability_id": v["id"],
                 "summary": v.get("summary", ""),
@@ -131,8 +232,12 @@ class SecurityMatrix:
         self.pypi_api = PyPIAPI()  # Added PyPI insights
         # log callback from parent
         self.log_callback = None
+        # Dependency results visited so far: env scans share most of
+        # their dependency graphs, so a dep is resolved once per matrix
+        # instance instead of once per package that pulls it in
+        self._seen = {}
 
-    def build_matrix(self, package, version="latest"):
+    def build_matrix(self, package, version="latest", osv_vulns=None):
         timestamp = datetime.now().astimezone().isoformat()
         matrix = {
             "vulnerability_insights": {
@@ -156,14 +261,36 @@ class SecurityMatrix:
             # "classifiers": pypi_insights["classifiers"]
         })
 
-        # Main package
-        vulns = self.osv_api.get_vulnerabilities(package, version)
-        matrix["vulnerability_insights"]["developer_view"].extend(vulns)
-        # Dependencies
+        # Main package (callers that already batch-queried OSV pass the
+        # parsed result in to skip the per-package round trip)
+        if osv_vulns is None:
+            osv_vulns = self.osv_api.get_vulnerabilities(package, version)
+        matrix["vulnerability_insights"]["developer_view"].extend(osv_vulns)
+        # Dependencies: each needs a PyPI and an OSV round trip, so fetch
+        # them concurrently instead of two sequential RTTs per dep
+        # (executor.map keeps the report in dependency order)
         deps = self.deps_api.get_dependencies(package, version)
-        for dep_name, dep_version in deps:
-            # PyPI insights for dependency
-            dep_pypi_insights = self.pypi_api.get_deprecation_eol(dep_name, dep_version)
+
+        def fetch_dep(dep):
+            cached = self._seen.get(dep)
+            if cached is not None:
+                return cached
+            dep_name, dep_version = dep
+            result = (
+                dep_name,
+                dep_version,
+                self.pypi_api.get_deprecation_eol(dep_name, dep_version),
+                self.osv_api.get_vulnerabilities(dep_name, dep_version),
+            )
+            self._seen[dep] = result
+            return result
+
+        dep_results = []
+        if deps:
+            with ThreadPoolExecutor(max_workers=min(8, len(deps))) as executor:
+                dep_results = list(executor.map(fetch_dep, deps))
+
+        for dep_name, dep_version, dep_pypi_insights, dep_vulns in dep_results:
             matrix["vulnerability_insights"]["metadata"]["index_insights"].append({
                 "source": "PyPI",
                 "package": dep_name,
@@ -173,42 +300,88 @@ class SecurityMatrix:
                 "eol": dep_pypi_insights["eol"],
                 # "classifiers": dep_pypi_insights["classifiers"]
             })
-
-            dep_vulns = self.osv_api.get_vulnerabilities(dep_name, dep_version)
             for dv in dep_vulns:
                 dv["affected_components"] = [dep_name]
                 matrix["vulnerability_insights"]["developer_view"].append(dv)
-        # Summary counts
-        severity_counts = {"critical": 0, "high": 0, "medium": 0, "low": 0}
-        for v in matrix["vulnerability_insights"]["developer_view"]:
-            lvl = v["severity"]["level"].lower()
-            if lvl in severity_counts:
-                severity_counts[lvl] += 1
+        # Summary counts: Counter tallies in C, then project onto the
+        # known levels (drops "unknown" like the old loop did)
+        tally = Counter(
+            v["severity"]["level"].lower()
+            for v in matrix["vulnerability_insights"]["developer_view"]
+        )
+        severity_counts = {
+            level: tally.get(level, 0)
+            for level in ("critical", "high", "medium", "low")
+        }
         matrix["vulnerability_insights"]["tech_leader_view"]["total_vulnerabilities"] = len(matrix["vulnerability_insights"]["developer_view"])
         matrix["vulnerability_insights"]["tech_leader_view"]["severity_breakdown"] = severity_counts
         return matrix
 
-    def scan_pkg(self,pkg, version="latest", env_id=None):
-        """Scan a single package and save to DB."""
-        result = self.build_matrix(pkg, version)
+    def scan_pkg(self, pkg, version="latest", env_id=None, osv_vulns=None, save=True):
+        """Scan a single package and save to DB.
+
+        With save=False the matrix is returned unsaved, so callers
+        scanning many packages can batch the inserts themselves.
+        """
+        result = self.build_matrix(pkg, version, osv_vulns=osv_vulns)
+        if not save:
+            return result
         if env_id:
             DBHelper.save_vulnerability_info(env_id, result)
         return True
 
-    def scan_env(self, env_name, log_callback):
+    def scan_env(self, env_name, log_callback, packages=None):
 
-        """Scan all packages in an environment and save results."""
+        """Scan all packages in an environment and save results.
+
+        Callers that already listed the packages (e.g. for cache keying)
+        can pass them in to avoid a second pip invocation.
+        """
         env_id = DBHelper.get_or_create_env(env_name)
-        packages = list_packages(env_name)
-        pkg_scan_flag = {pkg: False for pkg in packages}
-        for i, (pkg, version) in enumerate(packages):
-            log_callback(f"Scanning package {pkg} (version: {version}) in environment {env_name}")
-            is_scanned = self.scan_pkg(pkg, version, env_id)
-            if is_scanned:
-                pkg_scan_flag[pkg] = True
-            else:
-                log_callback(f"Failed to scan package {pkg} in environment {env_name}")
-                continue
+        if packages is None:
+            packages = list_packages(env_name)
+        pkg_scan_flag = {pkg: False for pkg, _version in packages}
+        # One querybatch POST prefilters the top-level packages: the
+        # (usually large) vulnerability-free majority maps to [] and
+        # skips its per-package OSV query; packages with findings are
+        # absent from the dict and get the detailed query in the worker
+        try:
+            batch_vulns = self.osv_api.get_vulnerabilities_batch(list(packages))
+        except Exception:
+            batch_vulns = {}
+        # The per-package work is blocking HTTPS round trips to OSV and
+        # deps.dev, so fan the scans out over a thread pool instead of
+        # paying one RTT chain per package sequentially
+        # Workers encode their own result, so serialization runs in
+        # parallel with the remaining scans instead of serially in the
+        # collection loop
+        def scan_and_encode(pkg, version, osv_vulns):
+            result = self.scan_pkg(pkg, version, env_id, osv_vulns=osv_vulns, save=False)
+            return _dumps(result).decode("utf-8") if result else None
+
+        rows = []
+        with ThreadPoolExecutor(max_workers=min(16, max(1, len(packages)))) as executor:
+            futures = {}
+            for pkg, version in packages:
+                log_callback(f"Scanning package {pkg} (version: {version}) in environment {env_name}")
+                futures[executor.submit(
+                    scan_and_encode, pkg, version,
+                    batch_vulns.get((pkg, version)),
+                )] = pkg
+            for future in as_completed(futures):
+                pkg = futures[future]
+                try:
+                    result = future.result()
+                except Exception:
+                    result = None
+                pkg_scan_flag[pkg] = bool(result)
+                if result:
+                    rows.append((env_id, result))
+                else:
+                    log_callback(f"Failed to scan package {pkg} in environment {env_name}")
+        # One transaction for the whole environment instead of one
+        # commit (and fsync) per package
+        DBHelper.save_vulnerability_info_bulk(rows)
         # Check if all packages were scanned
         if all(pkg_scan_flag.values()):
             log_callback(f"All packages in environment '{env_name}' scanned successfully.")